@@ -30,7 +30,8 @@ def resolve_host_dependencies(
     """
     executor = HostExecutor(debug=debug)
     orchestrator = Orchestrator(debug=debug, skip_os_packages=skip_os_packages, venv_path=venv_path)
-    dependencies = orchestrator.resolve_dependencies(executor, working_dir)
+    with executor:
+        dependencies = orchestrator.resolve_dependencies(executor, working_dir)
     formatter = OutputFormatter(debug=debug)
     return formatter.format_json(dependencies, pretty_print=pretty_print)
 
@@ -59,7 +60,8 @@ def resolve_docker_dependencies(
     """
     executor = DockerExecutor(container_identifier, debug=debug)
     orchestrator = Orchestrator(debug=debug, skip_os_packages=skip_os_packages, venv_path=venv_path)
-    dependencies = orchestrator.resolve_dependencies(executor, working_dir)
+    with executor:
+        dependencies = orchestrator.resolve_dependencies(executor, working_dir)
     formatter = OutputFormatter(debug=debug)
     return formatter.format_json(dependencies, pretty_print=pretty_print)
 
@@ -96,7 +98,8 @@ def resolve_docker_dependencies_as_dict(
 
     executor = DockerExecutor(container_identifier, debug=debug)
     orchestrator = Orchestrator(debug=debug, skip_os_packages=skip_os_packages, venv_path=venv_path)
-    return orchestrator.resolve_dependencies(executor, working_dir)
+    with executor:
+        return orchestrator.resolve_dependencies(executor, working_dir)
 
 
 def resolve_dependencies_as_dict(
@@ -132,7 +135,8 @@ def resolve_dependencies_as_dict(
         raise ValueError(f"Unsupported environment type: {environment_type}")
 
     orchestrator = Orchestrator(debug=debug, skip_os_packages=skip_os_packages, venv_path=venv_path)
-    return orchestrator.resolve_dependencies(executor, working_dir)
+    with executor:
+        return orchestrator.resolve_dependencies(executor, working_dir)
 
 
 def main() -> None:
@@ -130,7 +130,8 @@ def main() -> None:
             skip_hash_collection=args.skip_hash_collection,
             selected_detectors=args.select_detectors,
         )
-        dependencies = orchestrator.resolve_dependencies(executor, args.working_dir)
+        with executor:
+            dependencies = orchestrator.resolve_dependencies(executor, args.working_dir)
         formatter = OutputFormatter(debug=args.debug)
         result = formatter.format_json(dependencies, pretty_print=args.pretty_print)
         print(result)
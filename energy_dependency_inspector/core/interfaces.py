@@ -1,10 +1,18 @@
+import shlex
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional, Any
+from typing import Optional, Any, TypeVar
+
+_E = TypeVar("_E", bound="EnvironmentExecutor")
 
 
 class EnvironmentExecutor(ABC):
     """Abstract base class for executing commands in different environments."""
 
+    # Cached /etc/os-release result; the lock serializes the first read when detectors run concurrently
+    _os_release: Optional[tuple[str, str, int]] = None
+    _os_release_lock = threading.Lock()
+
     @abstractmethod
     def execute_command(self, command: str, working_dir: Optional[str] = None) -> tuple[str, str, int]:
         """Execute a command in the target environment."""
@@ -15,6 +23,38 @@ class EnvironmentExecutor(ABC):
         """Check if a path (file or directory) exists in the target environment."""
         raise NotImplementedError
 
+    def connect(self) -> None:
+        """Establish the connection to the target environment if that is deferred.
+
+        Raises RuntimeError if the environment cannot be reached. Does nothing by default.
+        """
+
+    def close(self) -> None:
+        """Release resources held in the target environment, such as persistent shell sessions.
+
+        Does nothing by default. Executors can also be used as context managers, which close them on exit.
+        """
+
+    def __enter__(self: _E) -> _E:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def read_file(self, path: str) -> tuple[str, str, int]:
+        """Read a file in the target environment as (stdout, stderr, exit_code), like `cat`."""
+        return self.execute_command(f"cat {shlex.quote(path)}")
+
+    def read_os_release(self) -> tuple[str, str, int]:
+        """Read /etc/os-release in the target environment as (stdout, stderr, exit_code).
+
+        The result is cached per executor since several detectors inspect it during one run.
+        """
+        with self._os_release_lock:
+            if self._os_release is None:
+                self._os_release = self.read_file("/etc/os-release")
+            return self._os_release
+
 
 class PackageManagerDetector(ABC):
     """Abstract base class for package manager detection and dependency extraction."""
@@ -0,0 +1,115 @@
+import fnmatch
+import hashlib
+import os
+import re
+import stat
+
+_GLOB_CHARACTERS = frozenset("*?[")
+
+
+class _NameMatcher:
+    """Match names against find -name style glob patterns.
+
+    Literal names are looked up in a set; all glob patterns are combined into one regex.
+    """
+
+    def __init__(self, patterns: tuple[str, ...]):
+        self.literals = frozenset(pattern for pattern in patterns if not _GLOB_CHARACTERS.intersection(pattern))
+        globs = [pattern for pattern in patterns if _GLOB_CHARACTERS.intersection(pattern)]
+        self.glob_re = re.compile("|".join(fnmatch.translate(pattern) for pattern in globs)) if globs else None
+
+    def matches(self, name: str) -> bool:
+        return name in self.literals or (self.glob_re is not None and self.glob_re.match(name) is not None)
+
+
+def hash_local_location(
+    location: str,
+    prune_names: tuple[str, ...] = (),
+    prune_paths: tuple[str, ...] = (),
+    exclude_names: tuple[str, ...] = (),
+) -> str:
+    """Hash a directory on the local file system without spawning find and sort.
+
+    Produces the same digest as hashing the stripped output of
+    `cd <location> && find . -name <prune> -prune -o ... -not -name <exclude> ...
+    \\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2`.
+    Returns an empty string if the location cannot be entered or contains no files.
+    """
+    if not os.path.isdir(location):
+        return ""
+
+    prune_name_matcher = _NameMatcher(prune_names)
+    prune_path_matcher = _NameMatcher(prune_paths)
+    exclude_name_matcher = _NameMatcher(exclude_names)
+
+    entries: list[tuple[int, bytes]] = []
+    stack = [(location, ".")]
+    while stack:
+        directory, relative_directory = stack.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                children = list(iterator)
+        except OSError:
+            # find reports unreadable directories on stderr and carries on
+            continue
+
+        for entry in children:
+            relative_path = f"{relative_directory}/{entry.name}"
+            if prune_name_matcher.matches(entry.name) or prune_path_matcher.matches(relative_path):
+                continue
+            try:
+                entry_stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+
+            if stat.S_ISDIR(entry_stat.st_mode):
+                stack.append((entry.path, relative_path))
+                continue
+            if exclude_name_matcher.matches(entry.name):
+                continue
+            if stat.S_ISLNK(entry_stat.st_mode):
+                try:
+                    link_target = os.readlink(entry.path)
+                except OSError:
+                    link_target = ""
+            elif stat.S_ISREG(entry_stat.st_mode):
+                link_target = ""
+            else:
+                continue
+            entries.append((entry_stat.st_size, os.fsencode(f"{entry_stat.st_size} {relative_path} {link_target}")))
+
+    return _hash_entries(entries)
+
+
+def hash_find_listing(listing: str) -> str:
+    """Hash the unsorted output of `find ... -printf '%s %p %l\\n'`.
+
+    Sorting happens here instead of in a `sort -n -k1,1 -k2,2` pipeline inside the
+    target environment, with the same resulting order and digest.
+    Returns an empty string if the listing contains no entries.
+    """
+    entries = []
+    for line in listing.split("\n"):
+        if line:
+            # sort -n treats a line without a leading number as 0
+            size = line.partition(" ")[0]
+            entries.append((int(size) if size.isdigit() else 0, line.encode()))
+    return _hash_entries(entries)
+
+
+def _hash_entries(entries: list[tuple[int, bytes]]) -> str:
+    """Sort (size, line) entries like `LC_COLLATE=C sort -n -k1,1 -k2,2` and hash the joined lines."""
+    if not entries:
+        return ""
+
+    # sort -n compares both keys numerically, so equal sizes fall back to a byte-wise comparison of the whole line
+    entries.sort()
+    digest = hashlib.sha256()
+    last_index = len(entries) - 1
+    for index, (_, line) in enumerate(entries):
+        if index == last_index:
+            # Matches hashing the stripped listing, which drops the trailing blank of the last line
+            digest.update(line.rstrip())
+        else:
+            digest.update(line + b"\n")
+    return digest.hexdigest()
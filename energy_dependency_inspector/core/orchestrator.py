@@ -1,4 +1,6 @@
-from typing import Optional, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Any
 from .interfaces import EnvironmentExecutor, PackageManagerDetector
 from ..detectors.pip_detector import PipDetector
 from ..detectors.npm_detector import NpmDetector
@@ -14,6 +16,9 @@ from ..detectors.pecl_detector import PeclDetector
 class Orchestrator:
     """Main orchestrator for dependency detection and extraction."""
 
+    # Upper bound for detectors probed and extracted concurrently
+    MAX_DETECTOR_WORKERS = 8
+
     def __init__(
         self,
         debug: bool = False,
@@ -26,102 +31,127 @@ class Orchestrator:
         self.skip_os_packages = skip_os_packages
         self.skip_hash_collection = skip_hash_collection
 
-        # Create all detector instances
-        all_detectors: list[PackageManagerDetector] = [
-            HostInfoDetector(),
-            DockerInfoDetector(),
-            DpkgDetector(),
-            ApkDetector(),
-            MavenDetector(debug=debug),
-            ComposerDetector(debug=debug),
-            PeclDetector(debug=debug),
-            PipDetector(venv_path=venv_path, debug=debug),
-            NpmDetector(debug=debug),
-        ]
-
-        # Filter detectors based on selection
+        # Detector factories by name, in the order detectors are run and reported
+        detector_factories: dict[str, Callable[[], PackageManagerDetector]] = {
+            HostInfoDetector.NAME: HostInfoDetector,
+            DockerInfoDetector.NAME: DockerInfoDetector,
+            DpkgDetector.NAME: DpkgDetector,
+            ApkDetector.NAME: ApkDetector,
+            MavenDetector.NAME: lambda: MavenDetector(debug=debug),
+            ComposerDetector.NAME: lambda: ComposerDetector(debug=debug),
+            PeclDetector.NAME: lambda: PeclDetector(debug=debug),
+            PipDetector.NAME: lambda: PipDetector(venv_path=venv_path, debug=debug),
+            NpmDetector.NAME: lambda: NpmDetector(debug=debug),
+        }
+
+        # Filter detectors based on selection; only the selected detectors are instantiated
         if selected_detectors:
             selected_names = [name.strip() for name in selected_detectors.split(",")]
-            available_names = {detector.NAME for detector in all_detectors}
 
             # Validate detector names
-            invalid_names = [name for name in selected_names if name not in available_names]
+            invalid_names = [name for name in selected_names if name not in detector_factories]
             if invalid_names:
                 raise ValueError(
-                    f"Invalid detector names: {', '.join(invalid_names)}. Available detectors: {', '.join(sorted(available_names))}"
+                    f"Invalid detector names: {', '.join(invalid_names)}. Available detectors: {', '.join(sorted(detector_factories))}"
                 )
 
-            # Filter to only selected detectors
-            self.detectors = [detector for detector in all_detectors if detector.NAME in selected_names]
+            selected = set(selected_names)
+            self.detectors = [factory() for name, factory in detector_factories.items() if name in selected]
             if self.debug:
                 selected_detector_names = [detector.NAME for detector in self.detectors]
                 print(f"Selected detectors: {', '.join(selected_detector_names)}")
         else:
-            self.detectors = all_detectors
+            self.detectors = [factory() for factory in detector_factories.values()]
 
     def resolve_dependencies(self, executor: EnvironmentExecutor, working_dir: Optional[str] = None) -> dict[str, Any]:
         """Resolve all dependencies from available package managers."""
+        # Connect up front so unreachable environments fail instead of being reported per detector
+        executor.connect()
+
         # Validate working directory if provided
         if working_dir is not None and not executor.path_exists(working_dir):
             raise ValueError(f"Working directory does not exist: {working_dir}")
 
         result: dict[str, Any] = {}
 
-        for detector in self.detectors:
-            detector_name = detector.NAME
+        # Detectors are independent of each other, so probe them and extract their dependencies
+        # concurrently. Results are still consumed and reported in detector order. The pool is joined
+        # on every exit path, so no detector thread keeps using the executor once this method returns.
+        with ThreadPoolExecutor(max_workers=self.MAX_DETECTOR_WORKERS) as detection_pool:
+            detections = [
+                detection_pool.submit(self._detect, detector, executor, working_dir) for detector in self.detectors
+            ]
 
             if self.debug:
-                print(f"Checking usability of {detector_name}...")
+                print(f"Running {len(self.detectors)} detectors concurrently; results are reported in detector order")
+
+            for detector, detection in zip(self.detectors, detections):
+                detector_name = detector.NAME
+
+                try:
+                    is_usable, dependencies, elapsed = detection.result()
+                    if is_usable:
+                        # OS package managers are not extracted with --skip-os-packages
+                        if dependencies is None:
+                            if self.debug:
+                                print(
+                                    f"Skipping {detector_name} (OS package manager, --skip-os-packages enabled, "
+                                    f"checked in {elapsed:.2f}s)"
+                                )
+                            continue
 
-            try:
-                if detector.is_usable(executor, working_dir):
-                    # Check if detector is OS package manager and skip if requested
-                    if self.skip_os_packages and detector.is_os_package_manager():
                         if self.debug:
-                            print(f"Skipping {detector_name} (OS package manager, --skip-os-packages enabled)")
-                        continue
-
-                    if self.debug:
-                        print(f"{detector_name} is usable, extracting dependencies...")
-
-                    dependencies = detector.get_dependencies(
-                        executor, working_dir, skip_hash_collection=self.skip_hash_collection
-                    )
-
-                    # Special handling for docker-info detector (simplified format)
-                    if detector_name == "docker-info":
-                        result["source"] = dependencies
-                        result["source"]["type"] = "container"
-                        if self.debug:
-                            print(f"Found container info for {detector_name}")
-                    elif detector_name == 'host-info':
-                        result["source"] = dependencies
-                        result["source"]["type"] = "host"
+                            print(f"{detector_name} is usable, extracted dependencies in {elapsed:.2f}s")
+
+                        # Special handling for docker-info detector (simplified format)
+                        if detector_name == "docker-info":
+                            result["source"] = dependencies
+                            result["source"]["type"] = "container"
+                            if self.debug:
+                                print(f"Found container info for {detector_name}")
+                        elif detector_name == 'host-info':
+                            result["source"] = dependencies
+                            result["source"]["type"] = "host"
+                        else:
+                            # Standard handling for other detectors
+                            # Check if result has dependencies (single location) or locations (mixed scope structure)
+                            has_dependencies = dependencies.get("dependencies") or (
+                                dependencies.get("scope") == "mixed" and dependencies.get("locations")
+                            )
+                            if has_dependencies or self.debug:
+                                result[detector_name] = dependencies
+
+                            if self.debug:
+                                if dependencies.get("scope") == "mixed":
+                                    # Count dependencies across all locations for mixed scope
+                                    dep_count = 0
+                                    for location_data in dependencies.get("locations", {}).values():
+                                        dep_count += len(location_data.get("dependencies", {}))
+                                else:
+                                    dep_count = len(dependencies.get("dependencies", {}))
+                                print(f"Found {dep_count} dependencies for {detector_name}")
                     else:
-                        # Standard handling for other detectors
-                        # Check if result has dependencies (single location) or locations (mixed scope structure)
-                        has_dependencies = dependencies.get("dependencies") or (
-                            dependencies.get("scope") == "mixed" and dependencies.get("locations")
-                        )
-                        if has_dependencies or self.debug:
-                            result[detector_name] = dependencies
-
                         if self.debug:
-                            if dependencies.get("scope") == "mixed":
-                                # Count dependencies across all locations for mixed scope
-                                dep_count = 0
-                                for location_data in dependencies.get("locations", {}).values():
-                                    dep_count += len(location_data.get("dependencies", {}))
-                            else:
-                                dep_count = len(dependencies.get("dependencies", {}))
-                            print(f"Found {dep_count} dependencies for {detector_name}")
-                else:
-                    if self.debug:
-                        print(f"{detector_name} is not available")
+                            print(f"{detector_name} is not available (checked in {elapsed:.2f}s)")
 
-            except (RuntimeError, OSError, ValueError) as e:
-                if self.debug:
-                    print(f"Error checking {detector_name}: {str(e)}")
-                continue
+                except (RuntimeError, OSError, ValueError) as e:
+                    if self.debug:
+                        print(f"Error checking {detector_name}: {str(e)}")
+                    continue
 
         return result
+
+    def _detect(
+        self, detector: PackageManagerDetector, executor: EnvironmentExecutor, working_dir: Optional[str]
+    ) -> tuple[bool, dict[str, Any] | None, float]:
+        """Check a detector's usability and extract its dependencies unless OS packages are skipped.
+
+        Also returns the time the detector took, for debug output.
+        """
+        start_time = time.perf_counter()
+        if not detector.is_usable(executor, working_dir):
+            return False, None, time.perf_counter() - start_time
+        if self.skip_os_packages and detector.is_os_package_manager():
+            return True, None, time.perf_counter() - start_time
+        dependencies = detector.get_dependencies(executor, working_dir, skip_hash_collection=self.skip_hash_collection)
+        return True, dependencies, time.perf_counter() - start_time
@@ -1,6 +1,12 @@
+import re
+import sys
 from typing import Optional, Any
 from ..core.interfaces import EnvironmentExecutor, PackageManagerDetector
 
+# Matches 'apk list --installed' lines: package-name-version architecture {origin} (license)
+# The non-greedy name leaves at most one dash in the version, mirroring rsplit("-", 2).
+_APK_LINE_RE = re.compile(r"^[ \t]*(?!WARNING:)(\S+?)-([^\s-]*(?:-[^\s-]*)?) (\S*)", re.MULTILINE)
+
 
 class ApkDetector(PackageManagerDetector):
     """Detector for system packages managed by apk (Alpine Linux)."""
@@ -9,7 +15,7 @@ class ApkDetector(PackageManagerDetector):
 
     def is_usable(self, executor: EnvironmentExecutor, working_dir: Optional[str] = None) -> bool:
         """Check if apk is usable (running on Alpine Linux and apk is available)."""
-        stdout, _, exit_code = executor.execute_command("cat /etc/os-release")
+        stdout, _, exit_code = executor.read_os_release()
         if exit_code == 0:
             meets_requirements = "alpine" in stdout.lower()
         else:
@@ -44,34 +50,12 @@ class ApkDetector(PackageManagerDetector):
         if exit_code != 0:
             return {"scope": "system", "dependencies": {}}
 
-        dependencies = {}
-        for line in stdout.strip().split("\n"):
-            line = line.strip()
-
-            if not line or line.startswith("WARNING:"):
-                continue
-
-            # Parse format: package-name-version [architecture] {status} (license)
-            # Example: bash-5.2.15-r5 x86_64 {bash} (GPL-3.0-or-later)
-            if " " in line:
-                parts = line.split(" ")
-                package_version = parts[0]
-                architecture = parts[1] if len(parts) > 1 else ""
-
-                # Extract package name and version from package-version string
-                if "-" in package_version:
-                    version_parts = package_version.rsplit("-", 2)
-                    if len(version_parts) >= 2:
-                        package_name = version_parts[0].strip()
-                        version = "-".join(version_parts[1:]).strip()
-
-                        full_version = f"{version} {architecture}" if architecture else version
-
-                        package_data = {
-                            "version": full_version,
-                        }
-
-                        dependencies[package_name] = package_data
+        # Example: bash-5.2.15-r5 x86_64 {bash} (GPL-3.0-or-later)
+        # Package names are interned since they recur as dictionary keys across runs in long-lived processes
+        dependencies = {
+            sys.intern(package_name): {"version": f"{version} {architecture}" if architecture else version}
+            for package_name, version, architecture in _APK_LINE_RE.findall(stdout)
+        }
 
         return {"scope": "system", "dependencies": dependencies}
 
@@ -1,8 +1,8 @@
-import hashlib
 import json
 from typing import Optional, Any
 
 from ..core.interfaces import EnvironmentExecutor, PackageManagerDetector
+from ..core.location_hash import hash_find_listing
 
 
 class ComposerDetector(PackageManagerDetector):
@@ -235,11 +235,13 @@ class ComposerDetector(PackageManagerDetector):
             "-name '*.log' -prune -o "
             "-not -name '*.tmp' "
             "-not -name '*.temp' "
-            "\\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2"
+            "\\( -type f -o -type l \\) -printf '%s %p %l\\n'"
         )
 
-        if exit_code == 0 and stdout.strip():
-            return hashlib.sha256(stdout.strip().encode()).hexdigest()
+        # find exits non-zero on unreadable subdirectories but still lists everything else
+        location_hash = hash_find_listing(stdout)
+        if location_hash:
+            return location_hash
 
         if self.debug:
             print(f"ERROR: composer_detector hash generation command failed with exit code {exit_code}")
@@ -41,7 +41,7 @@ class DockerInfoDetector(PackageManagerDetector):
         if "error" in container_info:
             result["error"] = container_info["error"]
 
-        stdout, stderr, exit_code = executor.execute_command("cat /etc/os-release")
+        stdout, stderr, exit_code = executor.read_os_release()
 
         if exit_code == 0 and (match := re.search(r'PRETTY_NAME="?([^"]+)"?', stdout)):
             # Return simplified info structure as metadata
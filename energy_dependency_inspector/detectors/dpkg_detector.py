@@ -1,8 +1,13 @@
 import hashlib
+import re
+import shlex
 from typing import Optional, Any
 
 from ..core.interfaces import EnvironmentExecutor, PackageManagerDetector
 
+# Matches 'dpkg-query -W' lines formatted as package<TAB>version[<TAB>architecture]
+_DPKG_LINE_RE = re.compile(r"^([^\t\n]*)\t([^\t\n]*)(?:\t([^\t\n]*))?", re.MULTILINE)
+
 
 class DpkgDetector(PackageManagerDetector):
     """Detector for system packages managed by dpkg (Debian/Ubuntu)."""
@@ -14,7 +19,7 @@ class DpkgDetector(PackageManagerDetector):
 
     def is_usable(self, executor: EnvironmentExecutor, working_dir: Optional[str] = None) -> bool:
         """Check if dpkg is usable (running on Debian/Ubuntu and dpkg-query is available)."""
-        stdout, _, exit_code = executor.execute_command("cat /etc/os-release")
+        stdout, _, exit_code = executor.read_os_release()
         if exit_code == 0:
             os_info = stdout.lower()
             meets_requirements = "debian" in os_info or "ubuntu" in os_info
@@ -41,78 +46,73 @@ class DpkgDetector(PackageManagerDetector):
         if exit_code != 0:
             return {"scope": "system", "dependencies": {}}
 
-        # Collect all package hashes in a single batch operation (unless skipped)
-        batch_hashes = {} if skip_hash_collection else self._collect_all_package_hashes(executor)
-
-        dependencies = {}
-        for line in stdout.strip().split("\n"):
-            if line and "\t" in line:
-                parts = line.split("\t")
-                if len(parts) >= 2:
-                    package_name = parts[0].strip()
-                    version = parts[1].strip()
-                    architecture = parts[2].strip() if len(parts) > 2 else ""
-
-                    full_version = f"{version} {architecture}" if architecture else version
-
-                    package_data = {
-                        "version": full_version,
-                    }
-
-                    # Skip hash collection if requested
-                    if not skip_hash_collection:
-                        # Use batch-collected hash or fallback to individual lookup
-                        package_hash = batch_hashes.get(package_name)
-                        if not package_hash:
-                            package_hash = self._get_package_hash(executor, package_name, architecture)
-
-                        if package_hash:
-                            package_data["hash"] = package_hash
-
-                    dependencies[package_name] = package_data
+        packages = _DPKG_LINE_RE.findall(stdout)
+
+        package_hashes: dict[str, str] = {}
+        if not skip_hash_collection:
+            # Collect all package hashes in a single batch operation. Packages missing from it
+            # mostly have no md5sums file at all (metapackages, transitional packages) and stay
+            # without a hash; only names the batch parser maps to another package are looked up again.
+            package_hashes = dict(self._collect_all_package_hashes(executor))
+            missing_packages = [
+                (name, architecture)
+                for name, _, architecture in packages
+                if name not in package_hashes and self._extract_package_name_from_path(f"{name}.md5sums") != name
+            ]
+            if missing_packages:
+                package_hashes.update(self._collect_package_hashes(executor, missing_packages))
+
+        dependencies = {
+            package_name: {"version": f"{version} {architecture}" if architecture else version}
+            for package_name, version, architecture in packages
+        }
+        for package_name, package_data in dependencies.items():
+            package_hash = package_hashes.get(package_name)
+            if package_hash:
+                package_data["hash"] = package_hash
 
         return {"scope": "system", "dependencies": dependencies}
 
-    def _get_package_hash(self, executor: EnvironmentExecutor, package_name: str, architecture: str = "") -> str | None:
-        """Get package hash from dpkg md5sums file if available.
+    def _collect_package_hashes(self, executor: EnvironmentExecutor, packages: list[tuple[str, str]]) -> dict[str, str]:
+        """Collect hashes for specific packages from their md5sums files in a single command.
 
-        Extracts MD5 hashes from /var/lib/dpkg/info/{package}.md5sums and combines into SHA256.
-        Tries multiple file patterns to handle architecture-specific naming.
+        Tries multiple file patterns per package to handle architecture-specific naming
+        and uses the first non-empty file found.
         See docs/technical/detectors/dpkg_detector.md
+
+        Args:
+            packages: List of (package name, architecture) tuples
+
+        Returns:
+            Dict mapping package names to their combined SHA256 hash
         """
-        # Try different md5sums file patterns in order of preference
-        patterns = [
-            f"/var/lib/dpkg/info/{package_name}.md5sums",  # Standard pattern
-        ]
-
-        # Add architecture-specific patterns if architecture is available
-        if architecture:
-            patterns.extend(
-                [
-                    f"/var/lib/dpkg/info/{package_name}:{architecture}.md5sums",  # Multi-arch pattern
-                    f"/var/lib/dpkg/info/{package_name}-{architecture}.md5sums",  # Alternative pattern
-                ]
+        lookups = []
+        for package_name, architecture in packages:
+            # Try different md5sums file patterns in order of preference
+            patterns = [f"{package_name}.md5sums"]  # Standard pattern
+            if architecture:
+                patterns.extend(
+                    [
+                        f"{package_name}:{architecture}.md5sums",  # Multi-arch pattern
+                        f"{package_name}-{architecture}.md5sums",  # Alternative pattern
+                    ]
+                )
+
+            # Mark output with the multi-arch file name, which parsing maps back to the exact package
+            # name even if it ends in an architecture suffix
+            files = " ".join(shlex.quote(pattern) for pattern in patterns)
+            marker = shlex.quote(f"FILE:{package_name}:{architecture}.md5sums")
+            lookups.append(
+                f'for file in {files}; do if [ -s "$file" ]; then echo {marker}; cat "$file" 2>/dev/null || true; break; fi; done'
             )
 
-        for md5sums_file in patterns:
-            if executor.path_exists(md5sums_file):
-                try:
-                    stdout, _, exit_code = executor.execute_command(f"cat '{md5sums_file}'")
-                    if exit_code == 0 and stdout.strip():
-                        md5_hashes = []
-                        for line in stdout.strip().split("\n"):
-                            if line and " " in line:
-                                md5_hash = line.split(" ")[0].strip()
-                                if md5_hash:
-                                    md5_hashes.append(md5_hash)
-
-                        if md5_hashes:
-                            content = "\n".join(sorted(md5_hashes))
-                            return hashlib.sha256(content.encode()).hexdigest()
-                except (OSError, IOError):
-                    continue  # Try next pattern
-
-        return None
+        command = "cd /var/lib/dpkg/info 2>/dev/null && {\n" + "\n".join(lookups) + "\n}"
+        stdout, _, exit_code = executor.execute_command(command)
+
+        if exit_code != 0:
+            return {}
+
+        return self._parse_batch_hash_output(stdout)
 
     def _collect_all_package_hashes(self, executor: EnvironmentExecutor) -> dict[str, str]:
         """Collect all package hashes in a single batch operation.
@@ -160,8 +160,8 @@ done
         current_package = None
         current_md5s: list[str] = []
 
-        for line in batch_output.strip().split("\n"):
-            line = line.strip()
+        # md5sums lines have no surrounding whitespace, so lines are used as split
+        for line in batch_output.splitlines():
             if line.startswith("FILE:"):
                 # Process previous package if we have one
                 if current_package and current_md5s:
@@ -217,12 +217,21 @@ done
         return package_part
 
     def _combine_md5_hashes(self, md5_hashes: list[str]) -> str | None:
-        """Combine multiple MD5 hashes into a single SHA256 hash."""
+        """Combine multiple MD5 hashes into a single SHA256 hash.
+
+        Feeds the sorted hashes into the digest one by one instead of building the
+        newline-joined string first; the result is identical.
+        """
         if not md5_hashes:
             return None
 
-        content = "\n".join(sorted(md5_hashes))
-        return hashlib.sha256(content.encode()).hexdigest()
+        digest = hashlib.sha256()
+        separator = b""
+        for md5_hash in sorted(md5_hashes):
+            digest.update(separator)
+            digest.update(md5_hash.encode())
+            separator = b"\n"
+        return digest.hexdigest()
 
     def is_os_package_manager(self) -> bool:
         """DPKG manages OS-level packages."""
@@ -1,9 +1,16 @@
+import functools
 import platform
 from typing import Optional, Any
 from ..core.interfaces import EnvironmentExecutor, PackageManagerDetector
 from ..executors.host_executor import HostExecutor
 
 
+@functools.lru_cache(maxsize=1)
+def _host_metadata() -> tuple[str, str]:
+    """Return the platform and kernel version strings, which do not change during a process lifetime."""
+    return platform.platform(), platform.version()
+
+
 class HostInfoDetector(PackageManagerDetector):
     """Detector for Host metadata"""
 
@@ -27,9 +34,10 @@ class HostInfoDetector(PackageManagerDetector):
         if not isinstance(executor, HostExecutor):
             return {}
 
+        kernel_version, os_version = _host_metadata()
         result = {
-            "kernel_version": platform.platform(),
-            "os": platform.version()
+            "kernel_version": kernel_version,
+            "os": os_version
         }
 
         return result
@@ -1,9 +1,9 @@
-import hashlib
 import re
 import xml.etree.ElementTree as ET
 from typing import Optional, Any
 
 from ..core.interfaces import EnvironmentExecutor, PackageManagerDetector
+from ..core.location_hash import hash_find_listing
 
 
 class MavenDetector(PackageManagerDetector):
@@ -257,12 +257,13 @@ class MavenDetector(PackageManagerDetector):
             "-name 'target' -prune -o "
             "-name '.m2' -prune -o "
             "\\( -name 'pom.xml' -o -name '*.properties' \\) "
-            "-type f -printf '%s %p\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2"
+            "-type f -printf '%s %p\\n'"
         )
 
-        if exit_code == 0 and stdout.strip():
-            content = stdout.strip()
-            return hashlib.sha256(content.encode()).hexdigest()
+        # find exits non-zero on unreadable subdirectories but still lists everything else
+        location_hash = hash_find_listing(stdout)
+        if location_hash:
+            return location_hash
         else:
             if self.debug:
                 print(f"ERROR: maven_detector hash generation command failed with exit code {exit_code}")
@@ -1,9 +1,10 @@
-import hashlib
 import json
 import os
 from typing import Optional, Any
 
 from ..core.interfaces import EnvironmentExecutor, PackageManagerDetector
+from ..core.location_hash import hash_find_listing, hash_local_location
+from ..executors.host_executor import HostExecutor
 
 
 class NpmDetector(PackageManagerDetector):
@@ -11,6 +12,10 @@ class NpmDetector(PackageManagerDetector):
 
     NAME = "npm"
 
+    # Mirrors the filters of the find command in _generate_location_hash
+    HASH_PRUNE_NAMES = ("node_modules/.cache", "*.log", ".npm")
+    HASH_EXCLUDE_NAMES = ("*.tmp", "*.temp")
+
     def __init__(self, debug: bool = False):
         self.debug = debug
 
@@ -134,9 +139,10 @@ class NpmDetector(PackageManagerDetector):
             if self._is_system_location(node_modules_path):
                 continue
             project_dir = os.path.dirname(node_modules_path.rstrip("/"))
-            has_package_json = executor.path_exists(f"{project_dir}/package.json")
-            has_package_lock = executor.path_exists(f"{project_dir}/package-lock.json")
-            if has_package_json or has_package_lock:
+            # package-lock.json is only probed if there is no package.json
+            if executor.path_exists(f"{project_dir}/package.json") or executor.path_exists(
+                f"{project_dir}/package-lock.json"
+            ):
                 results.append(node_modules_path)
         return results
 
@@ -224,12 +230,21 @@ class NpmDetector(PackageManagerDetector):
         Implements package manager location hashing as part of multi-tiered hash strategy.
         See docs/technical/detectors/npm_detector.md
         """
+        if isinstance(executor, HostExecutor):
+            # Walk the directory in-process instead of spawning find and sort
+            location_hash = hash_local_location(
+                location, prune_names=self.HASH_PRUNE_NAMES, exclude_names=self.HASH_EXCLUDE_NAMES
+            )
+            if not location_hash and self.debug:
+                print(f"ERROR: npm_detector hash generation found no files in location: {location}")
+            return location_hash
+
         # Use environment-independent sorting for consistent hashes across systems.
         # Two-tier sort strategy: primary by file size (numeric), secondary by path (lexicographic).
         # Include both regular files and symbolic links to capture complete directory state.
         # For symlinks, include the target path (%l) to make hash sensitive to link changes.
         # The -printf format ensures consistent "size path [target]" output regardless of system.
-        # LC_COLLATE=C ensures byte-wise lexicographic sorting independent of system locale.
+        # Sorting happens byte-wise in Python, independent of the target's locale and sort implementation.
         # Excludes npm cache directories and temporary files that change frequently.
         stdout, _, exit_code = executor.execute_command(
             f"cd '{location}' && find . "
@@ -238,12 +253,13 @@ class NpmDetector(PackageManagerDetector):
             "-name '.npm' -prune -o "
             "-not -name '*.tmp' "
             "-not -name '*.temp' "
-            "\\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2"
+            "\\( -type f -o -type l \\) -printf '%s %p %l\\n'"
         )
 
-        if exit_code == 0 and stdout.strip():
-            content = stdout.strip()
-            return hashlib.sha256(content.encode()).hexdigest()
+        # find exits non-zero on unreadable subdirectories but still lists everything else
+        location_hash = hash_find_listing(stdout)
+        if location_hash:
+            return location_hash
         else:
             if self.debug:
                 print(f"ERROR: npm_detector hash generation command failed with exit code {exit_code}")
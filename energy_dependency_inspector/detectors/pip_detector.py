@@ -1,8 +1,14 @@
-import hashlib
 import os
+import re
+import shlex
 from typing import Optional, Any
 
 from ..core.interfaces import EnvironmentExecutor, PackageManagerDetector
+from ..core.location_hash import hash_find_listing, hash_local_location
+from ..executors.host_executor import HostExecutor
+
+# Matches "name==version" lines of pip list --format=freeze, split at the first "==" and with surrounding blanks stripped
+_FREEZE_LINE_RE = re.compile(r"^[^\S\n]*(.*?)[^\S\n]*==[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
 
 
 class PipDetector(PackageManagerDetector):
@@ -10,6 +16,14 @@ class PipDetector(PackageManagerDetector):
 
     NAME = "pip"
 
+    # Mirrors the filters of the find command in _generate_location_hash
+    HASH_PRUNE_NAMES = ("__pycache__", "__editable__*", "pip*", "setuptools*", "pkg_resources", "*distutils*")
+    HASH_PRUNE_PATHS = ("*/pip/_vendor",)
+    HASH_EXCLUDE_NAMES = ("*.pyc", "*.pyo", "INSTALLER", "RECORD")
+
+    # Separates the outputs of commands batched into one execution
+    SECTION_SEPARATOR = "---edi-section---"
+
     def __init__(self, venv_path: Optional[str] = None, debug: bool = False):
         self.explicit_venv_path = venv_path
         self.debug = debug
@@ -75,26 +89,30 @@ class PipDetector(PackageManagerDetector):
 
         for venv_path in self._find_venv_paths(executor, working_dir):
             venv_pip = f"{venv_path}/bin/pip"
-            stdout, _, exit_code = executor.execute_command(f"{venv_pip} list --format=freeze", working_dir)
-            if exit_code != 0:
+            # List packages and locate site-packages in one round trip. A venv has exactly one
+            # lib/python*/site-packages directory, so pip show is only needed if the glob is ambiguous.
+            # A failing pip show keeps the default location.
+            site_packages_glob = f"{shlex.quote(venv_path)}/lib/python*/site-packages"
+            stdout, _, exit_code = executor.execute_command(
+                f"{venv_pip} list --format=freeze && echo '{self.SECTION_SEPARATOR}' && "
+                f"{{ set -- {site_packages_glob}; "
+                f'if [ $# -eq 1 ] && [ -d "$1" ]; then echo "Location: $1"; else {venv_pip} show pip || true; fi; }}',
+                working_dir,
+            )
+            stdout, separator, location_stdout = stdout.partition(f"{self.SECTION_SEPARATOR}\n")
+            if exit_code != 0 or not separator:
                 continue
 
-            dependencies = {}
-            for line in stdout.strip().split("\n"):
-                if line and "==" in line:
-                    package_name, version = line.split("==", 1)
-                    dependencies[package_name.strip()] = {"version": version.strip()}
+            dependencies = self._parse_freeze_output(stdout)
 
             if not dependencies:
                 continue
 
-            location_stdout, _, location_exit_code = executor.execute_command(f"{venv_pip} show pip", working_dir)
             location = "/usr/lib/python3/dist-packages"
-            if location_exit_code == 0:
-                for line in location_stdout.split("\n"):
-                    if line.startswith("Location:"):
-                        location = line.split(":", 1)[1].strip()
-                        break
+            for line in location_stdout.splitlines():
+                if line.startswith("Location:"):
+                    location = line[len("Location:") :].strip()
+                    break
 
             result: dict[str, Any] = {"scope": "project", "location": location, "dependencies": dependencies}
             if not skip_hash_collection:
@@ -141,9 +159,9 @@ class PipDetector(PackageManagerDetector):
         for cmd in location_commands:
             location_stdout, _, location_exit_code = executor.execute_command(cmd, working_dir)
             if location_exit_code == 0:
-                for line in location_stdout.split("\n"):
+                for line in location_stdout.splitlines():
                     if line.startswith("Location:"):
-                        potential_location = line.split(":", 1)[1].strip()
+                        potential_location = line[len("Location:") :].strip()
                         # Only use if it looks like a system location
                         if self._is_system_location(potential_location):
                             location = potential_location
@@ -155,13 +173,7 @@ class PipDetector(PackageManagerDetector):
         if venv_paths and not self._is_system_location(location):
             return None
 
-        dependencies = {}
-        for line in stdout.strip().split("\n"):
-            if line and "==" in line:
-                package_name, version = line.split("==", 1)
-                package_name = package_name.strip()
-                version = version.strip()
-                dependencies[package_name] = {"version": version}
+        dependencies = self._parse_freeze_output(stdout)
 
         if not dependencies:
             return None
@@ -172,6 +184,10 @@ class PipDetector(PackageManagerDetector):
         result["dependencies"] = dependencies
         return result
 
+    def _parse_freeze_output(self, stdout: str) -> dict[str, dict[str, str]]:
+        """Parse `pip list --format=freeze` output into a name to version mapping."""
+        return {package_name: {"version": version} for package_name, version in _FREEZE_LINE_RE.findall(stdout)}
+
     def _is_system_location(self, location: str) -> bool:
         """Check if a location path represents a system-wide installation."""
         return location.startswith(("/usr/lib", "/usr/local/lib"))
@@ -204,7 +220,8 @@ class PipDetector(PackageManagerDetector):
             if not line.strip():
                 continue
             venv_path = os.path.dirname(line.strip())
-            if venv_path not in seen_paths and self._is_valid_venv_path(executor, venv_path):
+            # find just listed this pyvenv.cfg, so only the pip executable remains to be checked
+            if venv_path not in seen_paths and executor.path_exists(f"{venv_path}/bin/pip"):
                 venv_paths.append(venv_path)
                 seen_paths.add(venv_path)
 
@@ -235,12 +252,24 @@ class PipDetector(PackageManagerDetector):
         Implements package manager location hashing as part of multi-tiered hash strategy.
         See docs/technical/detectors/pip_detector.md
         """
+        if isinstance(executor, HostExecutor):
+            # Walk the directory in-process instead of spawning find and sort
+            location_hash = hash_local_location(
+                location,
+                prune_names=self.HASH_PRUNE_NAMES,
+                prune_paths=self.HASH_PRUNE_PATHS,
+                exclude_names=self.HASH_EXCLUDE_NAMES,
+            )
+            if not location_hash and self.debug:
+                print(f"ERROR: pip_detector hash generation found no files in location: {location}")
+            return location_hash
+
         # Use environment-independent sorting for consistent hashes across systems.
         # Two-tier sort strategy: primary by file size (numeric), secondary by path (lexicographic).
         # Include both regular files and symbolic links to capture complete directory state.
         # For symlinks, include the target path (%l) to make hash sensitive to link changes.
         # The -printf format ensures consistent "size path [target]" output regardless of system.
-        # LC_COLLATE=C ensures byte-wise lexicographic sorting independent of system locale.
+        # Sorting happens byte-wise in Python, independent of the target's locale and sort implementation.
         stdout, _, exit_code = executor.execute_command(
             f"cd '{location}' && find . "
             "-name '__pycache__' -prune -o "
@@ -254,11 +283,12 @@ class PipDetector(PackageManagerDetector):
             "-not -name '*.pyo' "
             "-not -name 'INSTALLER' "
             "-not -name 'RECORD' "
-            "\\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2"
+            "\\( -type f -o -type l \\) -printf '%s %p %l\\n'"
         )
-        if exit_code == 0 and stdout.strip():
-            content = stdout.strip()
-            return hashlib.sha256(content.encode()).hexdigest()
+        # find exits non-zero on unreadable subdirectories but still lists everything else
+        location_hash = hash_find_listing(stdout)
+        if location_hash:
+            return location_hash
         else:
             if self.debug:
                 print(f"ERROR: pip_detector hash generation command failed with exit code {exit_code}")
@@ -0,0 +1,38 @@
+import functools
+import re
+import shlex
+
+# Shell operations that cannot be executed without a shell
+_SHELL_OPERATOR_RE = re.compile(r"&&|[|<>;`$]")
+
+# Characters that need shlex to tokenize the command correctly
+_QUOTING_RE = re.compile(r"['\"\\]")
+
+
+def parse_simple_command(command: str) -> list[str] | None:
+    """Parse commands that can be executed directly without shell."""
+    parts = _parse_simple_command_cached(command)
+    return list(parts) if parts is not None else None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_simple_command_cached(command: str) -> tuple[str, ...] | None:
+    """Parse a command once; detectors issue the same command strings repeatedly."""
+    # Reject complex shell operations
+    if _SHELL_OPERATOR_RE.search(command):
+        return None
+
+    # Handle simple commands with arguments; plain whitespace splitting suffices without quoting
+    if _QUOTING_RE.search(command):
+        try:
+            parts = shlex.split(command)
+        except ValueError:
+            return None
+    else:
+        parts = command.split()
+
+    # Basic validation: ensure it looks like a simple command
+    if parts and not parts[0].startswith("-"):
+        return tuple(parts)
+
+    return None
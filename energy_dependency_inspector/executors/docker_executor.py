@@ -1,13 +1,55 @@
+import base64
+import functools
+import importlib
+import io
+import json
+import posixpath
 import shlex
+import socket
+import tarfile
+import threading
 import time
-from typing import Optional
+import uuid
+from typing import Any, Optional
 
 from ..core.interfaces import EnvironmentExecutor
+from .command_parser import parse_simple_command
 
-try:
-    import docker
-except ImportError:
-    docker = None  # type: ignore
+# os.ModeSymlink in the Go FileMode reported by the container archive stat header
+_GO_MODE_SYMLINK = 1 << 27
+
+
+@functools.lru_cache(maxsize=None)
+def _docker_module() -> Any:
+    """Import the docker package on first use, so host-only runs do not pay for loading it."""
+    try:
+        return importlib.import_module("docker")
+    except ImportError as exc:
+        raise ImportError(
+            "Docker package is required for Docker functionality. Please install it with: pip install docker"
+        ) from exc
+
+
+@functools.lru_cache(maxsize=None)
+def _get_shared_api_client() -> Any:
+    """Return the low-level Docker API client shared by all executors of this process.
+
+    It is created from the environment on the first connect.
+    """
+    return _docker_module().from_env().api
+
+
+def _stat_header_is_symlink(headers: Any) -> bool:
+    """Check whether an archive stat header describes a symlink.
+
+    The archive endpoint does not follow a symlink in the last path component, so a dangling
+    link would be reported as existing. The mode is a Go os.FileMode, which marks symlinks with bit 27.
+    """
+    try:
+        path_stat = json.loads(base64.b64decode(headers["X-Docker-Container-Path-Stat"]))
+        return bool(path_stat["mode"] & _GO_MODE_SYMLINK)
+    except (KeyError, TypeError, ValueError):
+        return True  # Treat an unreadable stat like a symlink and let the shell decide
 
 
 class DockerExecutor(EnvironmentExecutor):
@@ -19,35 +61,53 @@ class DockerExecutor(EnvironmentExecutor):
 
     def __init__(self, container_identifier: str, debug: bool = False):
         """Initialize Docker executor."""
-        if docker is None:
-            raise ImportError(
-                "Docker package is required for Docker functionality. Please install it with: pip install docker"
-            )
+        _docker_module()
 
         self.debug = debug
-
-        try:
-            self.client = docker.from_env()
-            self.container = self.client.containers.get(container_identifier)
-
-            if self.container.status != "running":
-                raise RuntimeError(
-                    f"Container '{container_identifier}' is not running (status: {self.container.status})"
-                )
+        self.container_identifier = container_identifier
+        self.api: Any = None
+        self.container_id: Optional[str] = None
+        self._connect_lock = threading.Lock()
+        self._session_sock: Any = None
+        self._session_failed = False
+        self._session_lock = threading.Lock()
+        self._session_marker = f"__edi_{uuid.uuid4().hex}__".encode()
+
+    def connect(self) -> None:
+        """Connect to the Docker daemon and look up the container on first use.
+
+        Deferred from __init__ so that constructing an executor costs no API calls.
+        """
+        docker = _docker_module()
+        with self._connect_lock:
+            if self.api is not None:
+                return
+
+            api = _get_shared_api_client()
+            try:
+                # Raw inspect data is enough; no high-level Container object is built
+                container_info = api.inspect_container(self.container_identifier)
+            except docker.errors.NotFound as exc:
+                raise RuntimeError(f"Container '{self.container_identifier}' not found") from exc
+            except docker.errors.APIError as e:
+                raise RuntimeError(f"Docker API error: {str(e)}") from e
+
+            status = container_info["State"]["Status"]
+            if status != "running":
+                raise RuntimeError(f"Container '{self.container_identifier}' is not running (status: {status})")
+
+            self.container_id = container_info["Id"]
+            self.api = api
 
             if self.debug:
-                print(f"Connected to Docker container: {container_identifier}")
-
-        except docker.errors.NotFound as exc:
-            raise RuntimeError(f"Container '{container_identifier}' not found") from exc
-        except docker.errors.APIError as e:
-            raise RuntimeError(f"Docker API error: {str(e)}") from e
+                print(f"Connected to Docker container: {self.container_identifier}")
 
     def execute_command(self, command: str, working_dir: Optional[str] = None) -> tuple[str, str, int]:
         """Execute a command inside the Docker container with direct execution fallback.
 
         Returns actual command exit code on success, or 1 for execution environment failures.
         """
+        docker = _docker_module()
         if self.debug:
             start_time = time.perf_counter()
             workdir_info = f" (workdir: {working_dir})" if working_dir else ""
@@ -55,19 +115,21 @@ class DockerExecutor(EnvironmentExecutor):
         else:
             start_time = None
 
+        self.connect()
+
         try:
-            # First, try with sh
-            result = self.container.exec_run(
-                cmd=["sh", "-c", command], stdout=True, stderr=True, tty=False, workdir=working_dir
+            # First, try the persistent sh session, then a one-shot sh exec
+            stdout_bytes, stderr_bytes, exit_code = self._execute_in_session(command, working_dir) or self._exec(
+                ["sh", "-c", command], working_dir
             )
-            stdout = result.output.decode("utf-8") if result.output else ""
-            stderr = ""
+            stdout = stdout_bytes.decode("utf-8", errors="replace")
+            stderr = stderr_bytes.decode("utf-8", errors="replace")
 
             if self.debug and start_time is not None:
                 elapsed_time = time.perf_counter() - start_time
-                print(f"Docker command completed in {elapsed_time:.3f}s with exit code: {result.exit_code}")
+                print(f"Docker command completed in {elapsed_time:.3f}s with exit code: {exit_code}")
 
-            return stdout, stderr, result.exit_code
+            return stdout, stderr, exit_code
 
         except docker.errors.APIError as e:
             # Check if this is a "sh not found" error
@@ -88,6 +150,7 @@ class DockerExecutor(EnvironmentExecutor):
         self, command: str, working_dir: Optional[str] = None, start_time: Optional[float] = None
     ) -> tuple[str, str, int]:
         """Fallback: execute simple commands directly without shell."""
+        docker = _docker_module()
         if start_time is None:
             start_time = time.perf_counter()
 
@@ -107,15 +170,15 @@ class DockerExecutor(EnvironmentExecutor):
             if self.debug:
                 print(f"Parsed command parts: {cmd_parts}")
 
-            result = self.container.exec_run(cmd=cmd_parts, stdout=True, stderr=True, tty=False, workdir=working_dir)
-            stdout = result.output.decode("utf-8") if result.output else ""
-            stderr = ""
+            stdout_bytes, stderr_bytes, exit_code = self._exec(cmd_parts, working_dir)
+            stdout = stdout_bytes.decode("utf-8", errors="replace")
+            stderr = stderr_bytes.decode("utf-8", errors="replace")
 
             if self.debug:
                 elapsed_time = time.perf_counter() - start_time
-                print(f"Direct execution completed in {elapsed_time:.3f}s with exit code: {result.exit_code}")
+                print(f"Direct execution completed in {elapsed_time:.3f}s with exit code: {exit_code}")
 
-            return stdout, stderr, result.exit_code
+            return stdout, stderr, exit_code
 
         except docker.errors.APIError as e:
             if self.debug:
@@ -123,45 +186,205 @@ class DockerExecutor(EnvironmentExecutor):
                 print(f"Direct execution failed after {elapsed_time:.3f}s: {str(e)}")
             return "", f"Direct execution failed: {str(e)}", 1
 
-    @staticmethod
-    def _parse_simple_command(command: str) -> list[str] | None:
-        """Parse commands that can be executed directly without shell."""
-        # Reject complex shell operations
-        if any(op in command for op in ["&&", "||", "|", ">", "<", ";", "`", "$(", "$"]):
+    def _exec(self, cmd: list[str], working_dir: Optional[str] = None) -> tuple[bytes, bytes, int]:
+        """Run a one-shot exec instance via the low-level API and return stdout, stderr and exit code."""
+        exec_id = self.api.exec_create(
+            self.container_id, cmd, stdout=True, stderr=True, tty=False, workdir=working_dir
+        )["Id"]
+        stdout, stderr = self.api.exec_start(exec_id, tty=False, demux=True)
+        exit_code = self.api.exec_inspect(exec_id)["ExitCode"]
+        return stdout or b"", stderr or b"", exit_code
+
+    def _execute_in_session(
+        self, command: str, working_dir: Optional[str] = None
+    ) -> tuple[bytearray, bytearray, int] | None:
+        """Run a command through a long-lived sh process to avoid one exec instance per command.
+
+        Each command runs in its own subshell with stdin closed. Completion is signalled by a
+        per-executor marker written to stdout (followed by the exit code) and to stderr, so
+        output of both streams is fully attributed to the command. Returns None if no session
+        is usable or it is busy.
+        """
+        docker = _docker_module()
+        if self._session_failed:
             return None
+        # The session serves one command at a time; concurrent callers use one-shot execs.
+        # The acquire is non-blocking on purpose, so it cannot be a with statement.
+        if not self._session_lock.acquire(blocking=False):  # pylint: disable=consider-using-with
+            return None
+
+        script = f"sh -c {shlex.quote(command)}"
+        if working_dir:
+            script = f"cd {shlex.quote(working_dir)} && {script}"
+        marker = self._session_marker.decode()
+        payload = f"({script}) </dev/null; printf '\\000%s %d\\n' '{marker}' $?; printf '\\000%s\\n' '{marker}' >&2\n"
 
-        # Handle simple commands with arguments
         try:
-            parts = shlex.split(command)
-            # Basic validation: ensure it looks like a simple command
-            if parts and not parts[0].startswith("-"):
-                return parts
-        except ValueError:
-            pass
+            if self._session_sock is None:
+                self._session_sock = self._open_session()
+            getattr(self._session_sock, "_sock", self._session_sock).sendall(payload.encode())
+            return self._read_session_result()
+        except (docker.errors.APIError, docker.utils.socket.SocketError, OSError, ValueError) as e:
+            if self.debug:
+                print(f"Persistent shell session unavailable, using one-shot execs: {str(e)}")
+            self.close()
+            self._session_failed = True
+            return None
+        finally:
+            self._session_lock.release()
+
+    def _open_session(self) -> Any:
+        """Start a sh process with attached stdin and return the raw exec socket."""
+        exec_id = self.api.exec_create(self.container_id, ["sh"], stdin=True, stdout=True, stderr=True, tty=False)["Id"]
+        return self.api.exec_start(exec_id, tty=False, socket=True)
+
+    def _read_session_result(self) -> tuple[bytearray, bytearray, int]:
+        """Read multiplexed output frames until both streams carry the current command's marker."""
+        docker = _docker_module()
+        terminator = b"\0" + self._session_marker
+        stdout = bytearray()
+        stderr = bytearray()
+        exit_code: int | None = None
+        stderr_done = False
+
+        while exit_code is None or not stderr_done:
+            stream, size = docker.utils.socket.next_frame_header(self._session_sock)
+            if size < 0:
+                raise docker.utils.socket.SocketError("Shell session closed")
+            data = docker.utils.socket.read_exactly(self._session_sock, size)
+
+            # The markers are the last output of each stream, so only the tail needs checking
+            if stream == docker.utils.socket.STDERR:
+                stderr += data
+                stderr_done = stderr.endswith(terminator + b"\n")
+            else:
+                stdout += data
+                if stdout.endswith(b"\n"):
+                    index = stdout.rfind(terminator + b" ", max(0, len(stdout) - len(terminator) - 16))
+                    if index != -1:
+                        exit_code = int(stdout[index + len(terminator) :].strip())
+
+        # Drop the markers in place; the buffers are decoded directly without intermediate bytes copies
+        del stdout[stdout.rfind(terminator + b" ") :]
+        del stderr[len(stderr) - len(terminator) - 1 :]
+        return stdout, stderr, exit_code
+
+    def close(self) -> None:
+        """Close the persistent sh session, if one is open.
+
+        Over the unix socket transport, docker-py hands out a SocketIO wrapper whose close() leaves
+        the underlying socket open, so the socket itself is shut down to send EOF to the sh process.
+        """
+        if self._session_sock is not None:
+            raw = getattr(self._session_sock, "_sock", self._session_sock)
+            try:
+                raw.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass  # Already disconnected
+            try:
+                raw.close()
+            except OSError:
+                pass
+            self._session_sock = None
 
-        return None
+    @staticmethod
+    def _parse_simple_command(command: str) -> list[str] | None:
+        """Parse commands that can be executed directly without shell."""
+        return parse_simple_command(command)
 
     def path_exists(self, path: str) -> bool:
-        """Check if a path (file or directory) exists inside the Docker container."""
+        """Check if a path (file or directory) exists inside the Docker container.
+
+        Absolute paths are probed with a HEAD request on the container archive endpoint,
+        which stats the path without starting a process in the container. Relative paths,
+        symlinks and unexpected API responses fall back to `test -e`.
+        """
+        self.connect()
+
+        if path.startswith("/"):
+            try:
+                response = self.api.head(self._archive_url(), params={"path": path})
+                if response.status_code == 200 and not _stat_header_is_symlink(response.headers):
+                    return True
+                if response.status_code == 404:
+                    return False
+            except OSError:
+                pass
+
         try:
             _, _, exit_code = self.execute_command(f'test -e "{path}"')
             return exit_code == 0
         except (OSError, ValueError):
             return False
 
+    def _archive_url(self) -> str:
+        """Return the URL of this container's archive endpoint.
+
+        docker-py has no public method for a bare HEAD on this endpoint, so the URL is built
+        with its private `_url` helper, kept in this one place.
+        """
+        return str(self.api._url("/containers/{0}/archive", self.container_id))
+
+    def read_file(self, path: str) -> tuple[str, str, int]:
+        """Read a file inside the Docker container.
+
+        Absolute paths are fetched as a tar stream from the container archive endpoint,
+        which needs no process in the container. Falls back to `cat` if that is not possible.
+        """
+        docker = _docker_module()
+        self.connect()
+
+        if path.startswith("/"):
+            try:
+                content = self._read_archive_file(path)
+                if content is not None:
+                    return content.decode("utf-8", errors="replace"), "", 0
+            except docker.errors.NotFound:
+                return "", f"cat: {path}: No such file or directory", 1
+            except (docker.errors.APIError, OSError, tarfile.TarError) as e:
+                if self.debug:
+                    print(f"Reading {path} from container archive failed, using cat: {str(e)}")
+
+        return super().read_file(path)
+
+    def _read_archive_file(self, path: str, max_symlinks: int = 8) -> bytes | None:
+        """Return the content of a regular file from the container archive, following symlinks.
+
+        Returns None if the path does not resolve to a regular file.
+        """
+        for _ in range(max_symlinks + 1):
+            stream, _ = self.api.get_archive(self.container_id, path)
+            with tarfile.open(fileobj=io.BytesIO(b"".join(stream))) as archive:
+                member = archive.next()
+                if member is None:
+                    return None
+                # The archive endpoint does not follow a symlink at the requested path
+                # (e.g. /etc/os-release -> ../usr/lib/os-release)
+                if member.issym():
+                    path = posixpath.normpath(posixpath.join(posixpath.dirname(path), member.linkname))
+                    continue
+                if not member.isfile():
+                    return None
+                file = archive.extractfile(member)
+                return file.read() if file is not None else None
+        return None
+
     def get_container_info(self) -> dict:
         """Get container metadata including image name and hash."""
+        docker = _docker_module()
+        self.connect()
+
+        # Inspect again to get the latest info
+        container_info = self.api.inspect_container(self.container_id)
+        name = container_info["Name"].lstrip("/")
+
         try:
-            # Reload container to get latest info
-            self.container.reload()
-
-            # Get image information
-            image = self.container.image
-            if image is None:
-                return {"name": self.container.name, "image": "unknown", "image_hash": "unknown"}
-            image_name = sorted(image.tags)[0] if image.tags else "unknown"
-            image_id = image.id
-
-            return {"name": self.container.name, "image": image_name, "image_hash": image_id}
-        except (AttributeError, KeyError, ValueError) as e:
-            return {"name": self.container.name, "image": "unknown", "image_hash": "unknown", "error": str(e)}
+            image_info = self.api.inspect_image(container_info["Image"])
+            tags = [tag for tag in image_info.get("RepoTags") or [] if tag != "<none>:<none>"]
+            image_name = sorted(tags)[0] if tags else "unknown"
+
+            return {"name": name, "image": image_name, "image_hash": image_info["Id"]}
+        except docker.errors.NotFound:
+            return {"name": name, "image": "unknown", "image_hash": "unknown"}
+        except (docker.errors.APIError, KeyError, ValueError) as e:
+            return {"name": name, "image": "unknown", "image_hash": "unknown", "error": str(e)}
@@ -3,8 +3,32 @@ import subprocess
 import time
 
 from ..core.interfaces import EnvironmentExecutor
+from .command_parser import parse_simple_command
 from typing import Optional
 
+# Characters that the shell would expand or interpret beyond what parse_simple_command rejects
+SHELL_EXPANSION_CHARACTERS = ("*", "?", "[", "~", "&", "#", "(", ")", "\n")
+
+# Commands that only exist as shell builtins and cannot be executed directly
+SHELL_BUILTINS = {
+    ".",
+    "alias",
+    "cd",
+    "command",
+    "eval",
+    "exec",
+    "exit",
+    "export",
+    "read",
+    "set",
+    "source",
+    "type",
+    "ulimit",
+    "umask",
+    "unset",
+    "wait",
+}
+
 
 class HostExecutor(EnvironmentExecutor):
     """Executor for running commands on the host system."""
@@ -25,10 +49,15 @@ class HostExecutor(EnvironmentExecutor):
         else:
             start_time = None
 
+        # Simple commands are executed directly to avoid spawning /bin/sh for every call
+        argv = self._split_simple_command(command)
+
         try:
             result = subprocess.run(
-                command,
-                shell=True,
+                argv if argv else command,
+                shell=argv is None,
+                # Commands never read input; an inherited terminal could otherwise make tools like npm wait on it
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 cwd=working_dir,
@@ -47,11 +76,25 @@ class HostExecutor(EnvironmentExecutor):
                 print(f"Host command timed out after {elapsed_time:.3f}s")
             return "", "Command timed out after 30 seconds", 1
         except (subprocess.SubprocessError, OSError) as e:
+            if argv and isinstance(e, FileNotFoundError) and e.filename == argv[0]:
+                # Mirror the shell's "command not found" result for directly executed commands
+                return "", f"{argv[0]}: not found", 127
             if self.debug and start_time is not None:
                 elapsed_time = time.perf_counter() - start_time
                 print(f"Host command failed after {elapsed_time:.3f}s: {str(e)}")
             return "", f"Command execution failed: {str(e)}", 1
 
+    @staticmethod
+    def _split_simple_command(command: str) -> list[str] | None:
+        """Split commands that need no shell features into an argument list, or return None."""
+        if any(char in command for char in SHELL_EXPANSION_CHARACTERS):
+            return None
+
+        parts = parse_simple_command(command)
+        if not parts or parts[0] in SHELL_BUILTINS or "=" in parts[0]:
+            return None
+        return parts
+
     def path_exists(self, path: str) -> bool:
         """Check if a path (file or directory) exists on the host system."""
         return os.path.exists(path)
@@ -1,17 +1,59 @@
 """Base class for Docker-based detector tests."""
 
+import functools
+import hashlib
+import itertools
 import json
+import os
 import time
 from typing import Dict, Any, Optional
 
 import pytest
 
+from energy_dependency_inspector.executors import DockerExecutor
+
 try:
     import docker
 except ImportError:
     docker = None  # type: ignore
 
 
+@functools.lru_cache(maxsize=None)
+def docker_client() -> Any:
+    """Return the Docker client shared by all tests of the session, creating it on first use."""
+    if docker is None:
+        raise RuntimeError("Docker library not available")
+    return docker.from_env()
+
+
+def close_docker_client() -> None:
+    """Close the shared Docker client, if one was created."""
+    # pylint misreads the lru_cache wrapper's cache_info() signature
+    if docker_client.cache_info().currsize:  # pylint: disable=too-many-function-args
+        docker_client().close()
+        docker_client.cache_clear()
+
+
+# Label marking containers that are kept alive across tests when REUSE_DOCKER_CONTAINERS=1 is set
+REUSE_LABEL = "energy-dependency-inspector.test-reuse"
+
+
+def reuse_containers() -> bool:
+    """Check whether containers should be reused across test runs instead of started fresh."""
+    return os.environ.get("REUSE_DOCKER_CONTAINERS") == "1"
+
+
+def reused_container_name(test_id: str, image: str, command: list, env_vars: Dict[str, str]) -> str:
+    """Derive a deterministic container name from the test and everything that shapes its container.
+
+    Keying on the test keeps state that one test leaves behind (venvs, installed packages, project
+    files) out of every other test, so containers are only reused by reruns of the same test. It also
+    keeps names unique across pytest-xdist workers, since each test runs on exactly one worker.
+    """
+    key = json.dumps([test_id, image, command, sorted(env_vars.items())])
+    return f"edi-test-{hashlib.sha1(key.encode()).hexdigest()[:10]}"
+
+
 class DockerTestBase:
     """Base class providing common functionality for Docker-based detector tests."""
 
@@ -26,11 +68,15 @@ class DockerTestBase:
         additional_args: Optional[list] = None,
         env_vars: Optional[Dict[str, str]] = None,
     ) -> str:
-        """Start Docker container and return its ID."""
+        """Start Docker container and return its ID.
+
+        With REUSE_DOCKER_CONTAINERS=1, the container left by an earlier run of the same test with the
+        same image, command and environment is returned instead of starting a new one.
+        """
         if docker is None:
             pytest.fail("Docker library not available")
 
-        client = docker.from_env()
+        client = docker_client()
 
         # Prepare command
         if additional_args:
@@ -38,63 +84,77 @@ class DockerTestBase:
         else:
             command = ["sleep", sleep_duration]
 
+        env_vars = env_vars or {}
+        reuse = reuse_containers()
+        # PYTEST_CURRENT_TEST is "<node id> (<phase>)"; only the node id identifies the test
+        test_id = os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0]
+        name = reused_container_name(test_id, image, command, env_vars) if reuse else None
+
         try:
+            if name is not None:
+                try:
+                    container = client.containers.get(name)
+                    if container.status != "running":
+                        container.start()
+                    return str(container.id)
+                except docker.errors.NotFound:
+                    pass  # Not started by an earlier test yet
+
             container = client.containers.run(
                 image=image,
                 command=command,
-                environment=env_vars or {},
+                environment=env_vars,
                 detach=True,
-                remove=True,
+                name=name,
+                labels={REUSE_LABEL: "1"} if reuse else {},
+                remove=not reuse,
             )
             return str(container.id)
         except docker.errors.DockerException as e:
             pytest.fail(f"Failed to start container: {e}")
             return ""  # This line won't be reached due to pytest.fail, but satisfies mypy
 
-    def wait_for_container_ready(self, container_id: str, health_check_cmd: str, max_wait: int = 30) -> None:
-        """Wait for container to be ready using provided health check command."""
+    def wait_for_container_ready(self, container_id: str, health_check_cmd: str, max_wait: int = 30) -> DockerExecutor:
+        """Wait for container to be ready using provided health check command.
+
+        Polls with exponential backoff through a single executor, which reports a container that
+        is not running yet as a connection error and retries the lookup on the next attempt.
+        Returns that executor, so the test keeps using its connection and shell session.
+        """
         if docker is None:
             pytest.fail("Docker library not available")
 
-        client = docker.from_env()
-
-        start_time = time.time()
-        while time.time() - start_time < max_wait:
+        executor = DockerExecutor(container_id)
+        delay = 0.01
+        deadline = time.monotonic() + max_wait
+        while time.monotonic() < deadline:
             try:
-                container = client.containers.get(container_id)
-                container.reload()
+                _, _, exit_code = executor.execute_command(health_check_cmd)
+                if exit_code == 0:
+                    return executor
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass  # Continue waiting
 
-                if container.status == "running":
-                    try:
-                        # pylint: disable=import-outside-toplevel
-                        from energy_dependency_inspector.executors import (
-                            DockerExecutor,
-                        )
-
-                        executor = DockerExecutor(container_id)
-                        _, _, exit_code = executor.execute_command(health_check_cmd)
-                        if exit_code == 0:
-                            return
-                    except Exception:  # pylint: disable=broad-exception-caught
-                        pass  # Continue waiting
-
-                time.sleep(1)
-
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                print(f"Error checking container status: {e}")
-                time.sleep(1)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
 
+        executor.close()
         pytest.fail("Container did not become ready within timeout")
+        raise AssertionError("pytest.fail() does not return")
 
     def cleanup_container(self, container_id: str) -> None:
-        """Stop and remove the Docker container."""
-        if docker is None:
-            return  # Nothing to clean up if Docker library not available
+        """Kill the Docker container, which is removed automatically once it exits.
+
+        Reused containers are kept alive and removed at the end of the test session instead.
+        """
+        if docker is None or reuse_containers():
+            return  # Nothing to clean up now
 
         try:
-            client = docker.from_env()
+            client = docker_client()
             container = client.containers.get(container_id)
-            container.stop()
+            # sleep runs as PID 1 and ignores SIGTERM, so stop() would always wait out its 10s timeout
+            container.kill()
         except docker.errors.NotFound:
             pass  # Container already removed
         except docker.errors.DockerException:
@@ -143,7 +203,7 @@ class DockerTestBase:
 
     def validate_dependency_structure(self, dependencies: Dict[str, Any], sample_count: int = 5) -> None:
         """Validate structure of dependency entries."""
-        sample_deps = list(dependencies.items())[:sample_count]
+        sample_deps = itertools.islice(dependencies.items(), sample_count)
         for dep_name, dep_info in sample_deps:
             assert isinstance(dep_info, dict), f"Dependency {dep_name} should be a dict: {dep_info}"
             assert "version" in dep_info, f"Dependency {dep_name} should have version: {dep_info}"
@@ -0,0 +1,36 @@
+"""Executor stub shared by detector unit tests."""
+
+from typing import Optional
+
+from energy_dependency_inspector.core.interfaces import EnvironmentExecutor
+
+
+class FakeExecutor(EnvironmentExecutor):
+    """Executor returning canned command results and reporting a fixed set of existing paths.
+
+    Commands are matched exactly first, then by the prefixes in prefix_results. Commands without
+    a canned result fail with exit code 1. All executed commands are recorded in `commands`.
+    """
+
+    def __init__(
+        self,
+        command_results: dict[str, tuple[str, str, int]],
+        paths: set[str],
+        prefix_results: Optional[dict[str, tuple[str, str, int]]] = None,
+    ):
+        self.command_results = command_results
+        self.prefix_results = prefix_results or {}
+        self.paths = paths
+        self.commands: list[str] = []
+
+    def execute_command(self, command: str, working_dir: Optional[str] = None) -> tuple[str, str, int]:
+        self.commands.append(command)
+        if command in self.command_results:
+            return self.command_results[command]
+        for prefix, result in self.prefix_results.items():
+            if command.startswith(prefix):
+                return result
+        return "", "", 1
+
+    def path_exists(self, path: str) -> bool:
+        return path in self.paths
@@ -1,6 +1,19 @@
 """Pytest configuration for all tests."""
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
+
+import pytest
+
+from tests.common.docker_test_base import REUSE_LABEL, close_docker_client, docker_client, reuse_containers
+
+try:
+    import docker
+except ImportError:
+    docker = None  # type: ignore
+
+# Upper bound for concurrent image pulls at session start
+MAX_IMAGE_PULL_WORKERS = 8
 
 
 def pytest_addoption(parser: Any) -> None:
@@ -11,3 +24,82 @@ def pytest_addoption(parser: Any) -> None:
         default=False,
         help="Enable verbose output for energy-dependency-inspector",
     )
+    parser.addoption(
+        "--no-reuse-cleanup",
+        action="store_true",
+        default=False,
+        help="Keep containers reused via REUSE_DOCKER_CONTAINERS=1 running after the test session",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_docker_client() -> Iterator[None]:
+    """Close the Docker client shared by the Docker tests once the test session ends."""
+    yield
+    close_docker_client()
+
+
+def collect_test_images(items: list[pytest.Item]) -> list[str]:
+    """Collect the Docker images declared as *_IMAGE class attributes by the selected test classes."""
+    images = set()
+    for item in items:
+        test_class = getattr(item, "cls", None)
+        if test_class is None:
+            continue
+        for name, value in vars(test_class).items():
+            if name.endswith("_IMAGE") and isinstance(value, str):
+                images.add(value)
+    return sorted(images)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def prepull_docker_images(request: pytest.FixtureRequest) -> None:
+    """Pull the images of all selected Docker tests concurrently before the first test starts.
+
+    Every test still starts its own container, so tests cannot affect each other; only the
+    image downloads, which dominate container start time, are overlapped. Pull failures are
+    ignored here and surface in the test that starts the container.
+    """
+    images = collect_test_images(request.session.items)
+    if docker is None or not images:
+        return
+
+    try:
+        client = docker_client()
+    except docker.errors.DockerException:
+        return  # Docker tests report the unavailable daemon themselves
+
+    def pull(image: str) -> None:
+        try:
+            client.images.get(image)
+        except docker.errors.ImageNotFound:
+            try:
+                client.images.pull(image)
+            except docker.errors.DockerException:
+                pass
+        except docker.errors.DockerException:
+            pass
+
+    with ThreadPoolExecutor(max_workers=min(MAX_IMAGE_PULL_WORKERS, len(images))) as pool:
+        list(pool.map(pull, images))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Remove containers kept alive via REUSE_DOCKER_CONTAINERS=1 once the test session ends.
+
+    Under pytest-xdist, workers leave the cleanup to the controller, which finishes after all
+    workers, so no worker removes a container that a test on another worker is still using.
+    """
+    if hasattr(session.config, "workerinput"):
+        return
+    if docker is None or not reuse_containers() or session.config.getoption("--no-reuse-cleanup"):
+        return
+
+    try:
+        client = docker_client()
+        for container in client.containers.list(all=True, filters={"label": REUSE_LABEL}):
+            container.remove(force=True)
+    except docker.errors.DockerException:
+        pass  # Ignore cleanup errors
+    finally:
+        close_docker_client()
@@ -0,0 +1,74 @@
+"""Tests for the in-process location hash."""
+
+import hashlib
+import os
+import subprocess
+from pathlib import Path
+
+from energy_dependency_inspector.core.location_hash import hash_find_listing, hash_local_location
+
+
+def find_sort_hash(location: Path, find_filters: str) -> str:
+    """Hash the output of the find | sort pipeline used for container locations."""
+    stdout = subprocess.run(
+        f"cd '{location}' && find . {find_filters} \\( -type f -o -type l \\) -printf '%s %p %l\\n'"
+        " | LC_COLLATE=C sort -n -k1,1 -k2,2",
+        shell=True,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return hashlib.sha256(stdout.strip().encode()).hexdigest()
+
+
+def test_hash_matches_find_sort_pipeline(tmp_path: Path) -> None:
+    (tmp_path / "pkg" / "__pycache__").mkdir(parents=True)
+    (tmp_path / "pkg" / "__pycache__" / "mod.cpython-311.pyc").write_bytes(b"compiled")
+    (tmp_path / "pkg" / "__init__.py").write_text("abc")
+    (tmp_path / "pkg" / "b module.py").write_text("abc")
+    (tmp_path / "pkg" / "a.py").write_text("abc")
+    (tmp_path / "pkg-1.0.dist-info").mkdir()
+    (tmp_path / "pkg-1.0.dist-info" / "RECORD").write_text("pkg/__init__.py")
+    (tmp_path / "pip").mkdir()
+    (tmp_path / "pip" / "main.py").write_text("ignored")
+    os.symlink("pkg", tmp_path / "pkg-link")
+
+    location_hash = hash_local_location(
+        str(tmp_path),
+        prune_names=("__pycache__", "pip*"),
+        prune_paths=("*/pip/_vendor",),
+        exclude_names=("*.pyc", "RECORD"),
+    )
+
+    assert location_hash == find_sort_hash(
+        tmp_path,
+        "-name '__pycache__' -prune -o -name 'pip*' -prune -o -path '*/pip/_vendor' -prune -o "
+        "-not -name '*.pyc' -not -name 'RECORD'",
+    )
+
+
+def test_unsorted_listing_hash_matches_find_sort_pipeline(tmp_path: Path) -> None:
+    for name, content in [
+        ("b.py", "abc"),
+        ("a b.py", "abc"),
+        ("B.py", "abc"),
+        ("big.py", "abcdefghijkl"),
+        ("e.py", ""),
+    ]:
+        (tmp_path / name).write_text(content)
+    os.symlink("a b.py", tmp_path / "link")
+    listing = subprocess.run(
+        f"cd '{tmp_path}' && find . \\( -type f -o -type l \\) -printf '%s %p %l\\n'",
+        shell=True,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert hash_find_listing(listing) == find_sort_hash(tmp_path, "")
+    assert hash_find_listing("\n") == ""
+
+
+def test_hash_is_empty_for_missing_or_empty_location(tmp_path: Path) -> None:
+    assert hash_local_location(str(tmp_path / "missing")) == ""
+    assert hash_local_location(str(tmp_path)) == ""
@@ -1,6 +1,58 @@
+import threading
+from typing import Any, Optional
+
 import pytest
 from pytest import CaptureFixture
+from energy_dependency_inspector.core.interfaces import EnvironmentExecutor, PackageManagerDetector
 from energy_dependency_inspector.core.orchestrator import Orchestrator
+from energy_dependency_inspector.executors import HostExecutor
+
+
+class BarrierDetector(PackageManagerDetector):
+    """Detector whose usability probe only succeeds if all probes run at the same time."""
+
+    def __init__(self, name: str, barrier: threading.Barrier):
+        self.NAME = name
+        self.barrier = barrier
+
+    def is_usable(self, executor: EnvironmentExecutor, working_dir: Optional[str] = None) -> bool:
+        self.barrier.wait()
+        return True
+
+    def get_dependencies(
+        self, executor: EnvironmentExecutor, working_dir: Optional[str] = None, skip_hash_collection: bool = False
+    ) -> dict[str, Any]:
+        return {"scope": "system", "dependencies": {f"{self.NAME}-package": {"version": "1.0"}}}
+
+    def is_os_package_manager(self) -> bool:
+        return False
+
+
+class ExtractionBarrierDetector(BarrierDetector):
+    """Detector whose dependency extraction only succeeds if all extractions run at the same time."""
+
+    def is_usable(self, executor: EnvironmentExecutor, working_dir: Optional[str] = None) -> bool:
+        return True
+
+    def get_dependencies(
+        self, executor: EnvironmentExecutor, working_dir: Optional[str] = None, skip_hash_collection: bool = False
+    ) -> dict[str, Any]:
+        self.barrier.wait()
+        return super().get_dependencies(executor, working_dir, skip_hash_collection)
+
+
+class MinimalExecutor(EnvironmentExecutor):
+    """Custom executor that does not call EnvironmentExecutor.__init__."""
+
+    def __init__(self) -> None:  # pylint: disable=super-init-not-called
+        self.commands: list[str] = []
+
+    def execute_command(self, command: str, working_dir: Optional[str] = None) -> tuple[str, str, int]:
+        self.commands.append(command)
+        return "ID=alpine\n", "", 0
+
+    def path_exists(self, path: str) -> bool:
+        return False
 
 
 class TestOrchestrator:
@@ -28,6 +80,12 @@ class TestOrchestrator:
         expected_names = {"pip", "composer", "pecl", "dpkg"}
         assert detector_names == expected_names
 
+    def test_orchestrator_selected_detectors_keep_default_order(self) -> None:
+        """Test that selected detectors run in the default order, whatever order they are given in."""
+        orchestrator = Orchestrator(selected_detectors="npm,pip,dpkg,host-info")
+
+        assert [detector.NAME for detector in orchestrator.detectors] == ["host-info", "dpkg", "pip", "npm"]
+
     def test_orchestrator_select_single_detector(self) -> None:
         """Test selecting a single detector."""
         orchestrator = Orchestrator(selected_detectors="npm")
@@ -95,3 +153,47 @@ class TestOrchestrator:
 
         captured = capsys.readouterr()
         assert "Selected detectors: composer, pecl, pip, npm" in captured.out
+
+    def test_orchestrator_probes_detectors_concurrently(self) -> None:
+        """Test that usability probes run concurrently and results keep detector order."""
+        barrier = threading.Barrier(3, timeout=5)
+        orchestrator = Orchestrator()
+        orchestrator.detectors = [BarrierDetector(name, barrier) for name in ("first", "second", "third")]
+
+        result = orchestrator.resolve_dependencies(HostExecutor())
+
+        assert list(result.keys()) == ["first", "second", "third"]
+
+    def test_orchestrator_extracts_dependencies_concurrently(self) -> None:
+        """Test that dependency extraction runs concurrently across detectors and keeps detector order."""
+        barrier = threading.Barrier(3, timeout=5)
+        orchestrator = Orchestrator()
+        orchestrator.detectors = [ExtractionBarrierDetector(name, barrier) for name in ("first", "second", "third")]
+
+        result = orchestrator.resolve_dependencies(HostExecutor())
+
+        assert list(result.keys()) == ["first", "second", "third"]
+        assert result["second"]["dependencies"] == {"second-package": {"version": "1.0"}}
+
+    def test_orchestrator_supports_executor_without_base_init(self) -> None:
+        """Test that custom executors need not call EnvironmentExecutor.__init__."""
+        executor = MinimalExecutor()
+
+        Orchestrator(selected_detectors="dpkg,apk").resolve_dependencies(executor)
+
+        assert executor.read_os_release() == ("ID=alpine\n", "", 0)
+        assert executor.commands.count("cat /etc/os-release") == 1
+
+    def test_orchestrator_debug_output_reports_detectors_in_order(self, capsys: CaptureFixture[str]) -> None:
+        """Test that debug output reports each detector's outcome once its result is consumed."""
+        barrier = threading.Barrier(2, timeout=5)
+        orchestrator = Orchestrator(debug=True)
+        orchestrator.detectors = [ExtractionBarrierDetector(name, barrier) for name in ("first", "second")]
+
+        orchestrator.resolve_dependencies(HostExecutor())
+
+        output = capsys.readouterr().out
+        assert "Checking usability" not in output
+        assert output.index("first is usable, extracted dependencies in") < output.index(
+            "second is usable, extracted dependencies in"
+        )
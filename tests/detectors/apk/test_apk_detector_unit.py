@@ -0,0 +1,32 @@
+"""Unit tests for apk detector output parsing."""
+
+from energy_dependency_inspector.detectors.apk_detector import ApkDetector
+from tests.common.fake_executor import FakeExecutor
+
+
+def test_apk_list_output_is_parsed_into_name_and_version() -> None:
+    detector = ApkDetector()
+    executor = FakeExecutor(
+        command_results={
+            "apk list --installed": (
+                "WARNING: opening /etc/apk/repositories: No such file or directory\n"
+                "bash-5.2.15-r5 x86_64 {bash} (GPL-3.0-or-later) [installed]\n"
+                "py3-foo-bar-1.2.3-r0 noarch {py3-foo} (MIT) [installed]\n"
+                "ca-certificates-bundle-20230506-r0 x86_64 {ca-certificates} (MPL-2.0 AND MIT) [installed]\n",
+                "",
+                0,
+            ),
+        },
+        paths=set(),
+    )
+
+    result = detector.get_dependencies(executor)
+
+    assert result == {
+        "scope": "system",
+        "dependencies": {
+            "bash": {"version": "5.2.15-r5 x86_64"},
+            "py3-foo-bar": {"version": "1.2.3-r0 noarch"},
+            "ca-certificates-bundle": {"version": "20230506-r0 x86_64"},
+        },
+    }
@@ -36,7 +36,7 @@ def test_composer_project_detection() -> None:
                 0,
             ),
             "composer config vendor-dir --absolute": ("/app/vendor\n", "", 0),
-            "cd '/app/vendor' && find . -name '.git' -prune -o -name '.composer' -prune -o -name '*.log' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2": (
+            "cd '/app/vendor' && find . -name '.git' -prune -o -name '.composer' -prune -o -name '*.log' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n'": (
                 "12 ./composer/installed.json \n",
                 "",
                 0,
@@ -66,7 +66,7 @@ def test_composer_global_detection() -> None:
                 0,
             ),
             "composer global config vendor-dir --absolute": ("/root/.config/composer/vendor\n", "", 0),
-            "cd '/root/.config/composer/vendor' && find . -name '.git' -prune -o -name '.composer' -prune -o -name '*.log' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2": (
+            "cd '/root/.config/composer/vendor' && find . -name '.git' -prune -o -name '.composer' -prune -o -name '*.log' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n'": (
                 "24 ./autoload.php \n",
                 "",
                 0,
@@ -96,12 +96,12 @@ def test_composer_mixed_detection() -> None:
             ),
             "composer show --direct --format=json --no-interaction": ('{"installed":[{"name":"placeholder/package","version":"1.0.0"}]}', "", 0),
             "composer config vendor-dir --absolute": ("/srv/api/vendor\n", "", 0),
-            "cd '/srv/api/vendor' && find . -name '.git' -prune -o -name '.composer' -prune -o -name '*.log' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2": (
+            "cd '/srv/api/vendor' && find . -name '.git' -prune -o -name '.composer' -prune -o -name '*.log' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n'": (
                 "16 ./autoload.php \n",
                 "",
                 0,
             ),
-            "cd '/srv/app/vendor' && find . -name '.git' -prune -o -name '.composer' -prune -o -name '*.log' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2": (
+            "cd '/srv/app/vendor' && find . -name '.git' -prune -o -name '.composer' -prune -o -name '*.log' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n'": (
                 "18 ./autoload.php \n",
                 "",
                 0,
@@ -112,7 +112,7 @@ def test_composer_mixed_detection() -> None:
                 0,
             ),
             "composer global config vendor-dir --absolute": ("/root/.config/composer/vendor\n", "", 0),
-            "cd '/root/.config/composer/vendor' && find . -name '.git' -prune -o -name '.composer' -prune -o -name '*.log' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2": (
+            "cd '/root/.config/composer/vendor' && find . -name '.git' -prune -o -name '.composer' -prune -o -name '*.log' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n'": (
                 "24 ./autoload.php \n",
                 "",
                 0,
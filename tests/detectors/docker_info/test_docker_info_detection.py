@@ -23,6 +23,8 @@ except ImportError:
 class TestDockerInfoDetection(DockerTestBase):
     """Test Docker Info detector for individual container metadata."""
 
+    BUSYBOX_IMAGE = "quay.io/prometheus/busybox:latest"
+
     @pytest.mark.skipif(docker is None, reason="Docker not available")
     def test_docker_info_detection_real_container(self, request: pytest.FixtureRequest) -> None:
         """Test Docker Info detection using a real container."""
@@ -31,13 +33,12 @@ class TestDockerInfoDetection(DockerTestBase):
 
         try:
             # Start a test container (use non-Docker Hub image to test full repository name preservation)
-            container_id = self.start_container("quay.io/prometheus/busybox:latest", sleep_duration="60")
+            container_id = self.start_container(self.BUSYBOX_IMAGE, sleep_duration="60")
 
             # Wait for container to be ready
-            self.wait_for_container_ready(container_id, "echo ready", max_wait=10)
+            executor = self.wait_for_container_ready(container_id, "echo ready", max_wait=10)
 
             # Test Docker Info detection (container info only)
-            executor = DockerExecutor(container_id)
             orchestrator = Orchestrator(debug=False, selected_detectors="docker-info")
 
             result = orchestrator.resolve_dependencies(executor)
@@ -103,6 +104,8 @@ class TestDockerInfoDetection(DockerTestBase):
 class TestDockerInfoDetectorIntegration:
     """Integration tests for Docker Info detector with orchestrator."""
 
+    ALPINE_IMAGE = "alpine:latest"
+
     @pytest.mark.skipif(docker is None, reason="Docker not available")
     def test_orchestrator_docker_info_only_mode(self) -> None:
         """Test orchestrator with selected_detectors='docker-info'."""
@@ -111,7 +114,7 @@ class TestDockerInfoDetectorIntegration:
         try:
             # Start a test container
             base = DockerTestBase()
-            container_id = base.start_container("alpine:latest", sleep_duration="30")
+            container_id = base.start_container(self.ALPINE_IMAGE, sleep_duration="30")
 
             executor = DockerExecutor(container_id)
             orchestrator = Orchestrator(debug=False, selected_detectors="docker-info")
@@ -0,0 +1,80 @@
+"""Unit tests for dpkg detector output parsing and hashing."""
+
+import hashlib
+
+from energy_dependency_inspector.detectors.dpkg_detector import DpkgDetector
+from tests.common.fake_executor import FakeExecutor
+
+DPKG_QUERY_COMMAND = "dpkg-query -W -f='${Package}\t${Version}\t${Architecture}\n'"
+HASH_LOOKUP_PREFIX = "cd /var/lib/dpkg/info"
+
+
+def test_dpkg_query_output_is_parsed_without_hashes() -> None:
+    detector = DpkgDetector()
+    executor = FakeExecutor(
+        command_results={
+            DPKG_QUERY_COMMAND: (
+                "bash\t5.2.21-2ubuntu4\tamd64\nlibc6\t2.39-0ubuntu8\tamd64\ntzdata\t2024a-2\tall\n",
+                "",
+                0,
+            ),
+        },
+        paths=set(),
+    )
+
+    result = detector.get_dependencies(executor, skip_hash_collection=True)
+
+    assert result == {
+        "scope": "system",
+        "dependencies": {
+            "bash": {"version": "5.2.21-2ubuntu4 amd64"},
+            "libc6": {"version": "2.39-0ubuntu8 amd64"},
+            "tzdata": {"version": "2024a-2 all"},
+        },
+    }
+
+
+def test_only_mismapped_packages_missing_from_batch_are_looked_up() -> None:
+    detector = DpkgDetector()
+    detector._batch_hash_cache = {"bash": "bash-hash"}
+    executor = FakeExecutor(
+        command_results={
+            DPKG_QUERY_COMMAND: ("bash\t5.2.21-2ubuntu4\tamd64\nlibfoo-amd64\t1.0\tamd64\nmeta\t1\tall\n", "", 0),
+        },
+        paths=set(),
+        prefix_results={
+            HASH_LOOKUP_PREFIX: (
+                f"FILE:libfoo-amd64:amd64.md5sums\n{'b' * 32}  usr/lib/libfoo.so\n{'a' * 32}  usr/share/doc/libfoo\n",
+                "",
+                0,
+            ),
+        },
+    )
+
+    result = detector.get_dependencies(executor)
+
+    lookups = [command for command in executor.commands if command.startswith(HASH_LOOKUP_PREFIX)]
+    assert len(lookups) == 1
+    assert "libfoo-amd64.md5sums" in lookups[0]
+    assert "meta" not in lookups[0]
+    assert result["dependencies"]["bash"]["hash"] == "bash-hash"
+    expected_hash = hashlib.sha256(f"{'a' * 32}\n{'b' * 32}".encode()).hexdigest()
+    assert result["dependencies"]["libfoo-amd64"]["hash"] == expected_hash
+    assert "hash" not in result["dependencies"]["meta"]
+
+
+def test_packages_missing_from_batch_without_md5sums_are_not_looked_up() -> None:
+    detector = DpkgDetector()
+    detector._batch_hash_cache = {}
+    executor = FakeExecutor(
+        command_results={DPKG_QUERY_COMMAND: ("meta\t1\tall\nlibc6-dev\t2.39-0ubuntu8\tamd64\n", "", 0)},
+        paths=set(),
+    )
+
+    result = detector.get_dependencies(executor)
+
+    assert executor.commands == [DPKG_QUERY_COMMAND]
+    assert result == {
+        "scope": "system",
+        "dependencies": {"meta": {"version": "1 all"}, "libc6-dev": {"version": "2.39-0ubuntu8 amd64"}},
+    }
@@ -9,7 +9,6 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 import pytest
 
-from energy_dependency_inspector.executors import DockerExecutor
 from energy_dependency_inspector.core.orchestrator import Orchestrator
 from tests.common.docker_test_base import DockerTestBase
 
@@ -33,9 +32,7 @@ class TestDpkgDockerDetection(DockerTestBase):
 
         try:
             container_id = self.start_container(self.UBUNTU_IMAGE)
-            self.wait_for_container_ready(container_id, "dpkg-query --version")
-
-            executor = DockerExecutor(container_id)
+            executor = self.wait_for_container_ready(container_id, "dpkg-query --version")
             orchestrator = Orchestrator(debug=False)
 
             # Test base Ubuntu packages first
@@ -23,6 +23,7 @@ class TestMavenDockerDetection(DockerTestBase):
     """Test Maven dependency detection using Docker container environment."""
 
     TEST_IMAGE = "maven:3.9-eclipse-temurin-17"
+    JRE_IMAGE = "eclipse-temurin:17-jre"
 
     @pytest.mark.skipif(docker is None, reason="Docker not available")
     def test_maven_docker_container_detection(self, request: pytest.FixtureRequest) -> None:
@@ -34,9 +35,7 @@ class TestMavenDockerDetection(DockerTestBase):
         try:
             # Start container with Maven image
             container_id = self.start_container(self.TEST_IMAGE, additional_args=[])
-            self.wait_for_container_ready(container_id, "mvn --version", max_wait=60)
-
-            executor = DockerExecutor(container_id)
+            executor = self.wait_for_container_ready(container_id, "mvn --version", max_wait=60)
 
             # Create a simple Maven project for testing
             self._create_test_maven_project(executor)
@@ -65,9 +64,7 @@ class TestMavenDockerDetection(DockerTestBase):
         try:
             # Start container with Maven image
             container_id = self.start_container(self.TEST_IMAGE, additional_args=[])
-            self.wait_for_container_ready(container_id, "mvn --version", max_wait=60)
-
-            executor = DockerExecutor(container_id)
+            executor = self.wait_for_container_ready(container_id, "mvn --version", max_wait=60)
 
             # Create a Maven project with Maven wrapper
             self._create_test_maven_project_with_wrapper(executor)
@@ -95,10 +92,8 @@ class TestMavenDockerDetection(DockerTestBase):
 
         try:
             # Use a basic Eclipse Temurin JRE image without Maven
-            container_id = self.start_container("eclipse-temurin:17-jre", additional_args=[])
-            self.wait_for_container_ready(container_id, "java -version", max_wait=60)
-
-            executor = DockerExecutor(container_id)
+            container_id = self.start_container(self.JRE_IMAGE, additional_args=[])
+            executor = self.wait_for_container_ready(container_id, "java -version", max_wait=60)
 
             # Create a Maven project structure with pom.xml
             self._create_test_maven_project_without_maven(executor)
@@ -127,9 +122,7 @@ class TestMavenDockerDetection(DockerTestBase):
         try:
             # Start container with Maven image (has both system Maven and we'll add wrapper)
             container_id = self.start_container(self.TEST_IMAGE, additional_args=[])
-            self.wait_for_container_ready(container_id, "mvn --version", max_wait=60)
-
-            executor = DockerExecutor(container_id)
+            executor = self.wait_for_container_ready(container_id, "mvn --version", max_wait=60)
 
             # Create a Maven project with wrapper (this should be preferred)
             self._create_test_maven_project_with_wrapper(executor)
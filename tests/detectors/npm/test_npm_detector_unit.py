@@ -25,7 +25,7 @@ def test_npm_single_location_includes_node_version() -> None:
         command_results={
             "node --version": ("v22.11.0\n", "", 0),
             "cd '/app' && pwd": ("/app\n", "", 0),
-            "find '/app' -type d -name 'node_modules' -print 2>/dev/null | LC_COLLATE=C sort -u": (
+            "find '/app' -type d -name 'node_modules' -prune -print 2>/dev/null | LC_COLLATE=C sort -u": (
                 "/app/node_modules\n",
                 "",
                 0,
@@ -36,7 +36,7 @@ def test_npm_single_location_includes_node_version() -> None:
                 0,
             ),
             "npm list -g --json --depth=0": ("{}", "", 0),
-            "cd '/app/node_modules' && find . -name 'node_modules/.cache' -prune -o -name '*.log' -prune -o -name '.npm' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2": (
+            "cd '/app/node_modules' && find . -name 'node_modules/.cache' -prune -o -name '*.log' -prune -o -name '.npm' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n'": (
                 "12 ./package.json \n",
                 "",
                 0,
@@ -58,25 +58,25 @@ def test_npm_mixed_location_includes_node_version() -> None:
         command_results={
             "node --version": ("v20.18.1\n", "", 0),
             "cd '/workspace' && pwd": ("/workspace\n", "", 0),
-            "find '/workspace' -type d -name 'node_modules' -print 2>/dev/null | LC_COLLATE=C sort -u": (
+            "find '/workspace' -type d -name 'node_modules' -prune -print 2>/dev/null | LC_COLLATE=C sort -u": (
                 "/workspace/api/node_modules\n/workspace/web/node_modules\n",
                 "",
                 0,
             ),
             "npm list --json --depth=0": ('{"dependencies":{"jest":{"version":"29.7.0"}}}', "", 0),
             "npm list -g --json --depth=0": ('{"dependencies":{"npm":{"version":"10.8.2"}}}', "", 0),
-            "cd '/workspace/api/node_modules' && find . -name 'node_modules/.cache' -prune -o -name '*.log' -prune -o -name '.npm' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2": (
+            "cd '/workspace/api/node_modules' && find . -name 'node_modules/.cache' -prune -o -name '*.log' -prune -o -name '.npm' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n'": (
                 "12 ./package.json \n",
                 "",
                 0,
             ),
-            "cd '/workspace/web/node_modules' && find . -name 'node_modules/.cache' -prune -o -name '*.log' -prune -o -name '.npm' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2": (
+            "cd '/workspace/web/node_modules' && find . -name 'node_modules/.cache' -prune -o -name '*.log' -prune -o -name '.npm' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n'": (
                 "14 ./package.json \n",
                 "",
                 0,
             ),
             "npm config get prefix": ("/usr/local\n", "", 0),
-            "cd '/usr/local/lib/node_modules' && find . -name 'node_modules/.cache' -prune -o -name '*.log' -prune -o -name '.npm' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2": (
+            "cd '/usr/local/lib/node_modules' && find . -name 'node_modules/.cache' -prune -o -name '*.log' -prune -o -name '.npm' -prune -o -not -name '*.tmp' -not -name '*.temp' \\( -type f -o -type l \\) -printf '%s %p %l\\n'": (
                 "20 ./npm/package.json \n",
                 "",
                 0,
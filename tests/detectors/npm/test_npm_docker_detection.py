@@ -9,7 +9,6 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 import pytest
 
-from energy_dependency_inspector.executors import DockerExecutor
 from energy_dependency_inspector.core.orchestrator import Orchestrator
 from tests.common.docker_test_base import DockerTestBase
 
@@ -34,9 +33,7 @@ class TestNpmDockerDetection(DockerTestBase):
 
         try:
             container_id = self.start_container(self.IF_DOCKER_IMAGE, additional_args=[])
-            self.wait_for_container_ready(container_id, "npm --version", max_wait=60)
-
-            executor = DockerExecutor(container_id)
+            executor = self.wait_for_container_ready(container_id, "npm --version", max_wait=60)
             orchestrator = Orchestrator(debug=False, selected_detectors="npm")
 
             result = orchestrator.resolve_dependencies(executor)
@@ -124,9 +121,7 @@ class TestNpmDockerDetection(DockerTestBase):
 
         try:
             container_id = self.start_container(self.PLAYWRIGHT_DOCKER_IMAGE, additional_args=[])
-            self.wait_for_container_ready(container_id, "npm list -g --json --depth=0", max_wait=60)
-
-            executor = DockerExecutor(container_id)
+            executor = self.wait_for_container_ready(container_id, "npm list -g --json --depth=0", max_wait=60)
             orchestrator = Orchestrator(debug=False, selected_detectors="npm")
 
             result = orchestrator.resolve_dependencies(executor)
@@ -29,16 +29,22 @@ def test_pip_multiple_venvs_and_system_result_in_mixed_output() -> None:
                 "",
                 0,
             ),
-            "/opt/app1/bin/pip list --format=freeze": ("requests==2.31.0\n", "", 0),
-            "/opt/app1/bin/pip show pip": ("Location: /opt/app1/lib/python3.11/site-packages\n", "", 0),
-            "cd '/opt/app1/lib/python3.11/site-packages' && find . -name '__pycache__' -prune -o -name '__editable__*' -prune -o -name 'pip*' -prune -o -name 'setuptools*' -prune -o -name 'pkg_resources' -prune -o -name '*distutils*' -prune -o -path '*/pip/_vendor' -prune -o -not -name '*.pyc' -not -name '*.pyo' -not -name 'INSTALLER' -not -name 'RECORD' \\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2": (
+            '/opt/app1/bin/pip list --format=freeze && echo \'---edi-section---\' && { set -- /opt/app1/lib/python*/site-packages; if [ $# -eq 1 ] && [ -d "$1" ]; then echo "Location: $1"; else /opt/app1/bin/pip show pip || true; fi; }': (
+                "requests==2.31.0\n---edi-section---\nLocation: /opt/app1/lib/python3.11/site-packages\n",
+                "",
+                0,
+            ),
+            "cd '/opt/app1/lib/python3.11/site-packages' && find . -name '__pycache__' -prune -o -name '__editable__*' -prune -o -name 'pip*' -prune -o -name 'setuptools*' -prune -o -name 'pkg_resources' -prune -o -name '*distutils*' -prune -o -path '*/pip/_vendor' -prune -o -not -name '*.pyc' -not -name '*.pyo' -not -name 'INSTALLER' -not -name 'RECORD' \\( -type f -o -type l \\) -printf '%s %p %l\\n'": (
                 "10 ./requests/__init__.py \n",
                 "",
                 0,
             ),
-            "/opt/app2/bin/pip list --format=freeze": ("click==8.1.7\n", "", 0),
-            "/opt/app2/bin/pip show pip": ("Location: /opt/app2/lib/python3.11/site-packages\n", "", 0),
-            "cd '/opt/app2/lib/python3.11/site-packages' && find . -name '__pycache__' -prune -o -name '__editable__*' -prune -o -name 'pip*' -prune -o -name 'setuptools*' -prune -o -name 'pkg_resources' -prune -o -name '*distutils*' -prune -o -path '*/pip/_vendor' -prune -o -not -name '*.pyc' -not -name '*.pyo' -not -name 'INSTALLER' -not -name 'RECORD' \\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2": (
+            '/opt/app2/bin/pip list --format=freeze && echo \'---edi-section---\' && { set -- /opt/app2/lib/python*/site-packages; if [ $# -eq 1 ] && [ -d "$1" ]; then echo "Location: $1"; else /opt/app2/bin/pip show pip || true; fi; }': (
+                "click==8.1.7\n---edi-section---\nLocation: /opt/app2/lib/python3.11/site-packages\n",
+                "",
+                0,
+            ),
+            "cd '/opt/app2/lib/python3.11/site-packages' && find . -name '__pycache__' -prune -o -name '__editable__*' -prune -o -name 'pip*' -prune -o -name 'setuptools*' -prune -o -name 'pkg_resources' -prune -o -name '*distutils*' -prune -o -path '*/pip/_vendor' -prune -o -not -name '*.pyc' -not -name '*.pyo' -not -name 'INSTALLER' -not -name 'RECORD' \\( -type f -o -type l \\) -printf '%s %p %l\\n'": (
                 "8 ./click/__init__.py \n",
                 "",
                 0,
@@ -53,7 +59,7 @@ def test_pip_multiple_venvs_and_system_result_in_mixed_output() -> None:
                 "",
                 0,
             ),
-            "cd '/usr/lib/python3/dist-packages' && find . -name '__pycache__' -prune -o -name '__editable__*' -prune -o -name 'pip*' -prune -o -name 'setuptools*' -prune -o -name 'pkg_resources' -prune -o -name '*distutils*' -prune -o -path '*/pip/_vendor' -prune -o -not -name '*.pyc' -not -name '*.pyo' -not -name 'INSTALLER' -not -name 'RECORD' \\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2": (
+            "cd '/usr/lib/python3/dist-packages' && find . -name '__pycache__' -prune -o -name '__editable__*' -prune -o -name 'pip*' -prune -o -name 'setuptools*' -prune -o -name 'pkg_resources' -prune -o -name '*distutils*' -prune -o -path '*/pip/_vendor' -prune -o -not -name '*.pyc' -not -name '*.pyo' -not -name 'INSTALLER' -not -name 'RECORD' \\( -type f -o -type l \\) -printf '%s %p %l\\n'": (
                 "6 ./site.py \n",
                 "",
                 0,
@@ -87,9 +93,12 @@ def test_pip_single_location_includes_python_version() -> None:
                 "",
                 0,
             ),
-            "/app/venv/bin/pip list --format=freeze": ("flask==3.0.2\n", "", 0),
-            "/app/venv/bin/pip show pip": ("Location: /app/venv/lib/python3.11/site-packages\n", "", 0),
-            "cd '/app/venv/lib/python3.11/site-packages' && find . -name '__pycache__' -prune -o -name '__editable__*' -prune -o -name 'pip*' -prune -o -name 'setuptools*' -prune -o -name 'pkg_resources' -prune -o -name '*distutils*' -prune -o -path '*/pip/_vendor' -prune -o -not -name '*.pyc' -not -name '*.pyo' -not -name 'INSTALLER' -not -name 'RECORD' \\( -type f -o -type l \\) -printf '%s %p %l\\n' | LC_COLLATE=C sort -n -k1,1 -k2,2": (
+            '/app/venv/bin/pip list --format=freeze && echo \'---edi-section---\' && { set -- /app/venv/lib/python*/site-packages; if [ $# -eq 1 ] && [ -d "$1" ]; then echo "Location: $1"; else /app/venv/bin/pip show pip || true; fi; }': (
+                "flask==3.0.2\n---edi-section---\nLocation: /app/venv/lib/python3.11/site-packages\n",
+                "",
+                0,
+            ),
+            "cd '/app/venv/lib/python3.11/site-packages' && find . -name '__pycache__' -prune -o -name '__editable__*' -prune -o -name 'pip*' -prune -o -name 'setuptools*' -prune -o -name 'pkg_resources' -prune -o -name '*distutils*' -prune -o -path '*/pip/_vendor' -prune -o -not -name '*.pyc' -not -name '*.pyo' -not -name 'INSTALLER' -not -name 'RECORD' \\( -type f -o -type l \\) -printf '%s %p %l\\n'": (
                 "10 ./flask/__init__.py \n",
                 "",
                 0,
@@ -114,3 +123,9 @@ def test_pip_single_location_includes_python_version() -> None:
     assert result["scope"] == "project"
     assert result["python_version"] == "Python 3.11.9"
     assert result["location"] == "/app/venv/lib/python3.11/site-packages"
+
+
+def test_pip_freeze_output_parsing() -> None:
+    dependencies = PipDetector()._parse_freeze_output("requests==2.31.0\r\n click == 8.1.7 \nWARNING: ignored\n\n")
+
+    assert dependencies == {"requests": {"version": "2.31.0"}, "click": {"version": "8.1.7"}}
@@ -35,9 +35,7 @@ class TestPipDockerDetection(DockerTestBase):
         try:
             container_id = self.start_container(self.PYTHON_DOCKER_IMAGE)
             self._setup_pip_packages(container_id)
-            self.wait_for_container_ready(container_id, "pip --version", max_wait=60)
-
-            executor = DockerExecutor(container_id)
+            executor = self.wait_for_container_ready(container_id, "pip --version", max_wait=60)
             orchestrator = Orchestrator(debug=False, selected_detectors="pip")
 
             result = orchestrator.resolve_dependencies(executor)
@@ -120,9 +118,7 @@ class TestPipDockerDetection(DockerTestBase):
         try:
             container_id = self.start_container(self.PLAYWRIGHT_DOCKER_IMAGE)
             self._setup_root_venv_packages(container_id)
-            self.wait_for_container_ready(container_id, "python3 --version", max_wait=60)
-
-            executor = DockerExecutor(container_id)
+            executor = self.wait_for_container_ready(container_id, "python3 --version", max_wait=60)
             orchestrator = Orchestrator(debug=False, selected_detectors="pip")
 
             result = orchestrator.resolve_dependencies(executor)
@@ -0,0 +1,337 @@
+"""Unit tests for DockerExecutor that do not require a running Docker daemon."""
+
+import base64
+import functools
+import io
+import json
+import socket
+import struct
+import subprocess
+import sys
+import tarfile
+from typing import Any, Optional
+from unittest.mock import patch
+
+import pytest
+
+import energy_dependency_inspector
+from energy_dependency_inspector.core.orchestrator import Orchestrator
+from energy_dependency_inspector.executors import DockerExecutor
+from energy_dependency_inspector.executors import docker_executor
+
+try:
+    import docker
+except ImportError:
+    docker = None  # type: ignore
+
+pytestmark = pytest.mark.skipif(docker is None, reason="Docker library not available")
+
+
+class FakeAPIClient:
+    """Minimal low-level API client stub recording exec calls."""
+
+    def __init__(
+        self,
+        results: dict[str, tuple[bytes, int]],
+        session_sock: Any = None,
+        archive_status: Optional[dict[str, int]] = None,
+        archives: Optional[dict[str, bytes]] = None,
+        symlinks: Optional[set[str]] = None,
+    ):
+        self.results = results
+        self.session_sock = session_sock
+        self.archive_status = archive_status or {}
+        self.archives = archives or {}
+        self.symlinks = symlinks or set()
+        self.fetched: list[str] = []
+        self.created: list[tuple[list[str], Optional[str]]] = []
+        self._execs: dict[str, tuple[bytes, int]] = {}
+
+    def exec_create(self, _container: str, cmd: list[str], **kwargs: Any) -> dict[str, str]:
+        exec_id = f"exec-{len(self.created)}"
+        self.created.append((cmd, kwargs.get("workdir")))
+        self._execs[exec_id] = self.results.get(cmd[-1], (b"", 1))
+        return {"Id": exec_id}
+
+    def exec_start(self, exec_id: str, **kwargs: Any) -> Any:
+        if kwargs.get("socket"):
+            if self.session_sock is None:
+                raise docker.errors.APIError("session not supported")
+            return self.session_sock
+        return self._execs[exec_id][0], None
+
+    def inspect_container(self, identifier: str) -> dict[str, Any]:
+        return {"Id": identifier, "Name": "/web", "Image": "sha256:img", "State": {"Status": "running"}}
+
+    def exec_inspect(self, exec_id: str) -> dict[str, int]:
+        return {"ExitCode": self._execs[exec_id][1]}
+
+    def _url(self, pathfmt: str, *args: str) -> str:
+        return pathfmt.format(*args)
+
+    def head(self, url: str, params: dict[str, str]) -> Any:
+        assert url == "/containers/abc123/archive"
+        mode = (1 << 27 | 0o777) if params["path"] in self.symlinks else 0o644
+        path_stat = base64.b64encode(json.dumps({"name": params["path"], "mode": mode}).encode())
+        return type(
+            "Response",
+            (),
+            {
+                "status_code": self.archive_status.get(params["path"], 404),
+                "headers": {"X-Docker-Container-Path-Stat": path_stat},
+            },
+        )()
+
+    def get_archive(self, _container: str, path: str) -> tuple[Any, dict[str, Any]]:
+        self.fetched.append(path)
+        if path not in self.archives:
+            raise docker.errors.NotFound("Could not find the file")
+        data = self.archives[path]
+        return iter([data[:10], data[10:]]), {}
+
+
+def make_executor(api: FakeAPIClient) -> DockerExecutor:
+    executor = DockerExecutor("abc123")
+    with patch.object(docker_executor, "_get_shared_api_client", return_value=api):
+        executor.connect()
+    # A fixed marker lets the tests script the session output
+    executor._session_marker = b"__edi_test__"
+    return executor
+
+
+def tar_entry(name: str, content: bytes = b"", linkname: Optional[str] = None) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as archive:
+        info = tarfile.TarInfo(name)
+        if linkname is not None:
+            info.type = tarfile.SYMTYPE
+            info.linkname = linkname
+        else:
+            info.size = len(content)
+        archive.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def frame(data: bytes, stream: int = 1) -> bytes:
+    return struct.pack(">BxxxL", stream, len(data)) + data
+
+
+def test_execute_command_uses_low_level_exec_api() -> None:
+    api = FakeAPIClient({"pip --version": (b"pip 24.0\n", 0)})
+    executor = make_executor(api)
+
+    stdout, stderr, exit_code = executor.execute_command("pip --version", working_dir="/app")
+
+    assert (stdout, stderr, exit_code) == ("pip 24.0\n", "", 0)
+    assert api.created[-1] == (["sh", "-c", "pip --version"], "/app")
+
+
+def test_execute_command_returns_exit_code_of_failed_command() -> None:
+    api = FakeAPIClient({})
+    executor = make_executor(api)
+
+    _, _, exit_code = executor.execute_command("apk --version")
+
+    assert exit_code == 1
+
+
+def test_execute_command_reuses_persistent_session() -> None:
+    executor_end, container_end = socket.socketpair()
+    api = FakeAPIClient({}, session_sock=executor_end)
+    executor = make_executor(api)
+
+    container_end.sendall(frame(b"pip 24.0\n\0__edi_test__ 0\n") + frame(b"\0__edi_test__\n", stream=2))
+    container_end.sendall(
+        frame(b"sh: apk: not found\n", stream=2)
+        + frame(b"\0__edi_")
+        + frame(b"test__ 127\n")
+        + frame(b"\0__edi_test__\n", stream=2)
+    )
+
+    assert executor.execute_command("pip --version", working_dir="/app") == ("pip 24.0\n", "", 0)
+    assert executor.execute_command("apk --version") == ("", "sh: apk: not found\n", 127)
+    assert api.created == [(["sh"], None)]
+
+    sent = container_end.recv(4096).decode()
+    assert "(cd /app && sh -c 'pip --version') </dev/null;" in sent
+    assert "(sh -c 'apk --version') </dev/null;" in sent
+
+    executor.close()
+    container_end.close()
+
+
+def test_context_manager_closes_persistent_session() -> None:
+    executor_end, container_end = socket.socketpair()
+    # Over the unix socket transport, docker-py returns the SocketIO wrapper of the exec socket
+    session_file = executor_end.makefile("rb")
+    api = FakeAPIClient({}, session_sock=session_file.raw)
+    container_end.sendall(frame(b"pip 24.0\n\0__edi_test__ 0\n") + frame(b"\0__edi_test__\n", stream=2))
+
+    with make_executor(api) as executor:
+        assert executor.execute_command("pip --version") == ("pip 24.0\n", "", 0)
+
+    assert executor._session_sock is None
+    container_end.settimeout(1)
+    container_end.recv(4096)
+    assert container_end.recv(4096) == b""  # EOF on the session's stdin ends the sh in the container
+    container_end.close()
+
+
+def test_convenience_function_closes_executor(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[str] = []
+    monkeypatch.setattr(DockerExecutor, "close", lambda self: closed.append(self.container_identifier))
+    monkeypatch.setattr(Orchestrator, "resolve_dependencies", lambda self, executor, working_dir=None: {})
+
+    assert not energy_dependency_inspector.resolve_docker_dependencies_as_dict("web")
+    assert closed == ["web"]
+
+
+def test_execute_command_falls_back_when_session_closes() -> None:
+    executor_end, container_end = socket.socketpair()
+    api = FakeAPIClient({"pip --version": (b"pip 24.0\n", 0)}, session_sock=executor_end)
+    executor = make_executor(api)
+    container_end.close()
+
+    assert executor.execute_command("pip --version") == ("pip 24.0\n", "", 0)
+    assert executor._session_failed
+    assert api.created[-1] == (["sh", "-c", "pip --version"], None)
+
+
+def test_path_exists_uses_archive_stat_without_exec() -> None:
+    api = FakeAPIClient({}, archive_status={"/etc/os-release": 200})
+    executor = make_executor(api)
+
+    assert executor.path_exists("/etc/os-release")
+    assert not executor.path_exists("/etc/alpine-release")
+    assert not api.created
+
+
+def test_path_exists_falls_back_to_shell_on_unexpected_status() -> None:
+    api = FakeAPIClient({'test -e "/app/package.json"': (b"", 0)}, archive_status={"/app/package.json": 500})
+    executor = make_executor(api)
+    executor._session_failed = True
+
+    assert executor.path_exists("/app/package.json")
+    assert api.created[-1] == (["sh", "-c", 'test -e "/app/package.json"'], None)
+
+
+def test_path_exists_checks_symlinks_with_shell() -> None:
+    api = FakeAPIClient(
+        {'test -e "/usr/bin/python3"': (b"", 1)},
+        archive_status={"/usr/bin/python3": 200},
+        symlinks={"/usr/bin/python3"},
+    )
+    executor = make_executor(api)
+    executor._session_failed = True
+
+    assert not executor.path_exists("/usr/bin/python3")
+    assert api.created[-1] == (["sh", "-c", 'test -e "/usr/bin/python3"'], None)
+
+
+def test_execute_command_uses_one_shot_exec_while_session_is_busy() -> None:
+    executor_end, _ = socket.socketpair()
+    api = FakeAPIClient({"pip --version": (b"pip 24.0\n", 0)}, session_sock=executor_end)
+    executor = make_executor(api)
+
+    with executor._session_lock:
+        assert executor.execute_command("pip --version") == ("pip 24.0\n", "", 0)
+
+    assert not executor._session_failed
+    assert api.created == [(["sh", "-c", "pip --version"], None)]
+
+
+def test_execute_command_replaces_invalid_utf8_bytes() -> None:
+    api = FakeAPIClient({"dpkg-query --version": (b"caf\xe9\n", 0)})
+    executor = make_executor(api)
+    executor._session_failed = True
+
+    stdout, _, exit_code = executor.execute_command("dpkg-query --version")
+
+    assert exit_code == 0
+    assert stdout == "caf\ufffd\n"
+
+
+def test_executor_connects_on_first_use(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups: list[str] = []
+
+    class InspectingAPIClient:
+        def inspect_container(self, identifier: str) -> dict[str, Any]:
+            lookups.append(identifier)
+            raise docker.errors.NotFound("No such container")
+
+    monkeypatch.setattr(docker_executor, "_get_shared_api_client", InspectingAPIClient)
+    executor = DockerExecutor("missing-container")
+
+    assert not lookups
+    with pytest.raises(RuntimeError, match="Container 'missing-container' not found"):
+        executor.connect()
+    assert lookups == ["missing-container"]
+
+
+def test_executors_share_one_api_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: list[Any] = []
+
+    class InspectingAPIClient:
+        def inspect_container(self, identifier: str) -> dict[str, Any]:
+            return {"Id": f"{identifier}-id", "State": {"Status": "running"}}
+
+    class FakeDockerClient:
+        def __init__(self) -> None:
+            self.api = InspectingAPIClient()
+            created.append(self)
+
+    # A fresh cache keeps the fake client out of the process-wide one
+    fresh_factory = functools.lru_cache(maxsize=None)(docker_executor._get_shared_api_client.__wrapped__)
+    monkeypatch.setattr(docker_executor, "_get_shared_api_client", fresh_factory)
+    monkeypatch.setattr(docker, "from_env", FakeDockerClient)
+    first, second = DockerExecutor("first"), DockerExecutor("second")
+    first.connect()
+    second.connect()
+
+    assert len(created) == 1
+    assert first.api is second.api
+    assert (first.container_id, second.container_id) == ("first-id", "second-id")
+
+
+def test_get_container_info_uses_raw_inspect_data() -> None:
+    class InspectingAPIClient(FakeAPIClient):
+        def inspect_image(self, image: str) -> dict[str, Any]:
+            return {"Id": image, "RepoTags": ["repo/web:2", "<none>:<none>", "repo/web:1"]}
+
+    executor = make_executor(InspectingAPIClient({}))
+
+    assert executor.get_container_info() == {"name": "web", "image": "repo/web:1", "image_hash": "sha256:img"}
+
+
+def test_read_os_release_uses_archive_and_follows_symlink() -> None:
+    api = FakeAPIClient(
+        {},
+        archives={
+            "/etc/os-release": tar_entry("os-release", linkname="../usr/lib/os-release"),
+            "/usr/lib/os-release": tar_entry("os-release", b'ID=debian\nVERSION_ID="12"\n'),
+        },
+    )
+    executor = make_executor(api)
+
+    assert executor.read_os_release() == ('ID=debian\nVERSION_ID="12"\n', "", 0)
+    assert executor.read_os_release()[2] == 0
+    assert api.fetched == ["/etc/os-release", "/usr/lib/os-release"]
+    assert not api.created
+
+
+def test_read_file_reports_missing_file_without_exec() -> None:
+    api = FakeAPIClient({})
+    executor = make_executor(api)
+
+    _, _, exit_code = executor.read_file("/etc/os-release")
+
+    assert exit_code == 1
+    assert not api.created
+
+
+def test_package_import_does_not_load_docker() -> None:
+    check = "import sys, energy_dependency_inspector; print('docker' in sys.modules)"
+
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,69 @@
+"""Unit tests for HostExecutor command execution."""
+
+from typing import Optional
+
+import pytest
+
+from energy_dependency_inspector.executors import HostExecutor
+
+
+@pytest.mark.parametrize(
+    "command, expected",
+    [
+        ("python3 --version", ["python3", "--version"]),
+        ("cat '/etc/os-release'", ["cat", "/etc/os-release"]),
+        ("cd /tmp && pwd", None),
+        ("ls *.py", None),
+        ("cat ~/.bashrc", None),
+        ("unset VIRTUAL_ENV", None),
+        ("LC_ALL=C sort file", None),
+    ],
+)
+def test_split_simple_command(command: str, expected: list[str] | None) -> None:
+    assert HostExecutor._split_simple_command(command) == expected
+
+
+def test_simple_command_runs_without_shell() -> None:
+    stdout, _, exit_code = HostExecutor().execute_command("printf 'a b'")
+
+    assert exit_code == 0
+    assert stdout == "a b"
+
+
+def test_missing_command_reports_not_found_exit_code() -> None:
+    _, stderr, exit_code = HostExecutor().execute_command("definitely-not-an-installed-command --version")
+
+    assert exit_code == 127
+    assert "not found" in stderr
+
+
+def test_shell_command_keeps_shell_semantics() -> None:
+    stdout, _, exit_code = HostExecutor().execute_command("echo one && echo two | tr a-z A-Z")
+
+    assert exit_code == 0
+    assert stdout == "one\nTWO\n"
+
+
+def test_os_release_is_read_once_per_executor() -> None:
+    class CountingHostExecutor(HostExecutor):
+        def __init__(self) -> None:
+            super().__init__()
+            self.commands: list[str] = []
+
+        def execute_command(self, command: str, working_dir: Optional[str] = None) -> tuple[str, str, int]:
+            self.commands.append(command)
+            return 'ID=debian\nPRETTY_NAME="Debian GNU/Linux 12 (bookworm)"\n', "", 0
+
+    executor = CountingHostExecutor()
+
+    assert executor.read_os_release() == executor.read_os_release()
+    assert executor.commands == ["cat /etc/os-release"]
+
+
+def test_execute_command_does_not_inherit_stdin() -> None:
+    executor = HostExecutor()
+
+    stdout, _, exit_code = executor.execute_command("cat")
+
+    assert exit_code == 0
+    assert stdout == ""